@@ -48,6 +48,11 @@ sudo apt-get install -y fonts-dejavu fonts-dejavu-core || echo "Fonts already av
 echo "Installing network tools..."
 sudo apt-get install -y avahi-utils arp-scan nmap || echo "Some network tools not available"
 
+# Let the IP scanner run arp-scan as the pi user (no sudo per scan)
+if command -v arp-scan > /dev/null; then
+    sudo setcap cap_net_raw,cap_net_admin+eip "$(command -v arp-scan)" || echo "Could not set arp-scan capabilities"
+fi
+
 echo ""
 
 # Enable SPI and I2C interfaces
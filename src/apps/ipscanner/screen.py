@@ -4,23 +4,265 @@ IP Scanner Screen
 E-ink display screen for scanning and displaying network devices.
 """
 
+import asyncio
+import ipaddress
+import json
 import logging
+import os
+import re
 import socket
+import struct
 import subprocess
-from typing import List, Dict
-from PIL import Image, ImageDraw, ImageFont
+import threading
+import time
+from array import array
+from typing import Callable, Iterable, List, Dict, Optional, Tuple, Union
+from PIL import Image, ImageDraw
+from src.utils.fonts import get_font, get_default_font, text_width
+
+
+# Scanner output is parsed as raw bytes; only matched fields get decoded.
+# Octets are range-checked by the pattern itself, so a matched address is
+# always valid for inet_aton() without splitting it apart again
+_OCTET = rb'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+_IPV4 = _OCTET + rb'(?:\.' + _OCTET + rb'){3}'
+
+# arp-scan host line: "192.168.1.10<TAB>aa:bb:cc:dd:ee:ff<TAB>Vendor"
+_ARP_RE = re.compile(rb'^(' + _IPV4 + rb')\t([0-9A-Fa-f:]{17})(?:\t(.*))?$', re.M)
+
+# nmap host report and MAC lines, matched in output order
+_NMAP_RE = re.compile(
+    rb'^Nmap scan report for (?:\S+ \()?(?P<ip>' + _IPV4 + rb')(?!\d)\)?'
+    rb'|^\s*MAC Address: (?P<mac>[0-9A-Fa-f:]{17})(?: \((?P<vendor>[^)\n]*)\))?',
+    re.M
+)
+
+
+def _probe_order(count: int) -> List[int]:
+    """
+    Indices 0..count-1 in bit-reversed order
+
+    Consecutive probes land far apart in the network instead of bursting at
+    neighbouring addresses.
+    """
+    bits = max(1, (count - 1).bit_length())
+    return [r for r in (int(f'{i:0{bits}b}'[::-1], 2) for i in range(1 << bits)) if r < count]
+
+
+# ICMP echo request type (reply type is 0)
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Internet checksum (RFC 1071) for an ICMP packet"""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _icmp_echo_packet(seq: int, ident: int = 0) -> bytes:
+    """Build an ICMP echo request (datagram sockets overwrite the identifier)"""
+    payload = b'PiBook'
+    header = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = _icmp_checksum(header + payload)
+    return struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + payload
+
+
+def _open_icmp_socket() -> Tuple[socket.socket, bool]:
+    """
+    Open a socket for sending ICMP echo requests
+
+    Tries an unprivileged ICMP datagram socket first (allowed by
+    net.ipv4.ping_group_range), then a raw socket (needs root or
+    CAP_NET_RAW). Raises OSError if neither is permitted.
+
+    Returns:
+        (socket, is_raw) - raw sockets receive replies with the IP header
+    """
+    try:
+        return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP), False
+    except PermissionError:
+        return socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP), True
+
+
+# Local IP is cached so repeated renders don't open a socket each time
+IP_CACHE_TTL = 30  # seconds
+_ip_cache = {'ip': None, 'ts': 0.0}
+
+# Interface scanned by arp-scan; also used for the local IP lookup
+SCAN_INTERFACE = 'wlan0'
+SIOCGIFADDR = 0x8915  # Linux ioctl: get interface IPv4 address
+SIOCGIFNETMASK = 0x891b  # Linux ioctl: get interface IPv4 netmask
+
+# Sweep at most a /20 (4094 hosts) around us, even on larger networks
+DEFAULT_PREFIXLEN = 24
+MIN_SWEEP_PREFIXLEN = 20
+
+
+def _interface_ioctl_addr(ifname: str, request: int) -> Optional[str]:
+    """Run an address-returning SIOCGIF* ioctl and return the dotted quad"""
+    try:
+        import fcntl
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            ifreq = fcntl.ioctl(s.fileno(), request, struct.pack('256s', ifname.encode()[:15]))
+        return socket.inet_ntoa(ifreq[20:24])
+    except (ImportError, OSError):
+        return None
+
+
+def _get_interface_ip(ifname: str) -> Optional[str]:
+    """Read an interface's IPv4 address via ioctl (no route lookup)"""
+    return _interface_ioctl_addr(ifname, SIOCGIFADDR)
+
+
+def _local_network(local_ip: str) -> ipaddress.IPv4Network:
+    """
+    Network to scan around local_ip
+
+    Uses SCAN_INTERFACE's netmask (falling back to a /24), narrowed to at
+    most a /20 so a large network doesn't turn into a flood of probes.
+    """
+    netmask = _interface_ioctl_addr(SCAN_INTERFACE, SIOCGIFNETMASK)
+    try:
+        prefixlen = ipaddress.IPv4Network(f"0.0.0.0/{netmask}").prefixlen if netmask else DEFAULT_PREFIXLEN
+    except ValueError:
+        prefixlen = DEFAULT_PREFIXLEN
+
+    if prefixlen < MIN_SWEEP_PREFIXLEN:
+        logging.getLogger(__name__).warning(
+            f"Network /{prefixlen} is too large to sweep, limiting scan to /{MIN_SWEEP_PREFIXLEN}")
+        prefixlen = MIN_SWEEP_PREFIXLEN
+    return ipaddress.ip_network(f"{local_ip}/{prefixlen}", strict=False)
 
 
 def get_ip_address():
-    """Get the Pi's local IP address"""
+    """Get the Pi's local IP address (cached for IP_CACHE_TTL seconds)"""
+    now = time.monotonic()
+    if _ip_cache['ip'] is not None and now - _ip_cache['ts'] < IP_CACHE_TTL:
+        return _ip_cache['ip']
+
+    ip = _get_interface_ip(SCAN_INTERFACE)
+    if ip is None:
+        # Interface missing or not Linux - ask the routing table instead
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.connect(("8.8.8.8", 80))
+            ip = s.getsockname()[0]
+            s.close()
+        except Exception:
+            ip = "No Network"
+
+    _ip_cache['ip'] = ip
+    _ip_cache['ts'] = now
+    return ip
+
+
+def invalidate_ip_cache():
+    """Force the next get_ip_address() call to query the network again"""
+    _ip_cache['ip'] = None
+    _ip_cache['ts'] = 0.0
+
+
+# Reverse lookups keyed by IP -> (hostname, monotonic time); failures are
+# cached too since they are the slow case (every method times out)
+HOSTNAME_CACHE_TTL = 600  # seconds
+_hostname_cache: Dict[str, Tuple[str, float]] = {}
+
+PROC_ARP_PATH = '/proc/net/arp'
+
+
+def _read_proc_arp(path: str = PROC_ARP_PATH) -> Dict[str, str]:
+    """
+    Read the kernel ARP cache as {ip: mac}
+
+    Incomplete entries (flags 0x0) are skipped. Returns an empty dict if the
+    table can't be read (e.g. not Linux).
+    """
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except Exception:
-        return "No Network"
+        with open(path) as f:
+            lines = f.read().splitlines()[1:]
+    except OSError:
+        return {}
+
+    entries = {}
+    for line in lines:
+        # IP address, HW type, Flags, HW address, Mask, Device
+        fields = line.split()
+        if len(fields) >= 4 and fields[2] != '0x0':
+            entries[fields[0]] = fields[3].lower()
+    return entries
+
+
+class DeviceTable:
+    """
+    Discovered devices stored column-wise instead of one dict per device
+
+    IPs are packed into 32-bit ints and MACs into 6 bytes each; an all-zero
+    MAC means "Unknown".
+    """
+
+    __slots__ = ('ips', 'macs', 'names', 'hostnames', 'http')
+
+    def __init__(self):
+        self.ips = array('I')
+        self.macs = bytearray()
+        self.names: List[str] = []
+        self.hostnames: List[str] = []
+        self.http = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, ip: str, mac: str = 'Unknown', name: str = 'Unknown', hostname: str = '', http: bool = False):
+        """Add one device"""
+        self.ips.append(int.from_bytes(socket.inet_aton(ip), 'big'))
+        self.macs += bytes.fromhex(mac.replace(':', '')) if mac != 'Unknown' else bytes(6)
+        self.names.append(name)
+        self.hostnames.append(hostname)
+        self.http.append(1 if http else 0)
+
+    def index(self, ip: str) -> int:
+        """Row of the device with this IP, or -1"""
+        try:
+            return self.ips.index(int.from_bytes(socket.inet_aton(ip), 'big'))
+        except ValueError:
+            return -1
+
+    def set_mac(self, i: int, mac: str):
+        """Record the MAC of device i"""
+        self.macs[i * 6:i * 6 + 6] = bytes.fromhex(mac.replace(':', ''))
+
+    def sort_by_ip(self):
+        """Reorder every column by ascending IP"""
+        order = sorted(range(len(self)), key=self.ips.__getitem__)
+        self.ips = array('I', (self.ips[i] for i in order))
+        self.macs = bytearray(b''.join(self.macs[i * 6:i * 6 + 6] for i in order))
+        self.names = [self.names[i] for i in order]
+        self.hostnames = [self.hostnames[i] for i in order]
+        self.http = bytearray(self.http[i] for i in order)
+
+    def ip(self, i: int) -> str:
+        """Dotted-quad IP of device i"""
+        return socket.inet_ntoa(self.ips[i].to_bytes(4, 'big'))
+
+    def mac(self, i: int) -> str:
+        """Colon-separated MAC of device i, or 'Unknown'"""
+        raw = self.macs[i * 6:i * 6 + 6]
+        return raw.hex(':') if any(raw) else 'Unknown'
+
+    def as_dict(self, i: int) -> Dict[str, str]:
+        """Device i in the dict form used by the web API and scan cache"""
+        return {
+            'ip': self.ip(i),
+            'mac': self.mac(i),
+            'name': self.names[i],
+            'hostname': self.hostnames[i],
+            'http': bool(self.http[i])
+        }
 
 
 class IPScannerScreen:
@@ -28,7 +270,28 @@ class IPScannerScreen:
     IP Scanner screen - scans local network and displays devices
     """
 
-    def __init__(self, width: int = 800, height: int = 480, font_size: int = 18, battery_monitor=None):
+    # Battery icon body size in pixels
+    BATTERY_WIDTH = 25
+    BATTERY_HEIGHT = 12
+
+    # Charging bolt polygon, relative to the battery body centre
+    BOLT_OFFSETS = (
+        (2, -6),    # Top tip
+        (-2, -1),   # Upper left
+        (3, -1),    # Upper right
+        (-2, 6),    # Bottom tip
+        (2, 1),     # Lower right
+        (-3, 1),    # Lower left
+    )
+
+    # Cached scan results older than this are ignored on startup
+    DEVICE_CACHE_MAX_AGE = 300  # seconds
+
+    # Scan progress must move into a new step (percent) to warrant a redraw
+    PROGRESS_REDRAW_STEP = 5
+
+    def __init__(self, width: int = 800, height: int = 480, font_size: int = 18, battery_monitor=None,
+                 cache_file: str = "data/ipscan_cache.json"):
         """
         Initialize IP scanner screen
 
@@ -37,6 +300,7 @@ class IPScannerScreen:
             height: Screen height
             font_size: Base font size
             battery_monitor: Optional BatteryMonitor instance
+            cache_file: Path to JSON file holding the last scan results
         """
         self.width = width
         self.height = height
@@ -46,68 +310,139 @@ class IPScannerScreen:
 
         # Load fonts
         try:
-            self.font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-            self.title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-            self.small_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
+            self.font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
+            self.title_font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
+            self.small_font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
         except:
-            self.font = ImageFont.load_default()
-            self.title_font = ImageFont.load_default()
-            self.small_font = ImageFont.load_default()
+            self.font = get_default_font()
+            self.title_font = get_default_font()
+            self.small_font = get_default_font()
 
-        # Scan state
-        self.devices: List[Dict[str, str]] = []
+        # Scan state (the table is appended to from scan worker threads)
+        self._table = DeviceTable()
+        self._devices_lock = threading.Lock()
         self.scanning = False
+        self.enriching = False  # Hostname/port 80 lookups after discovery
         self.scan_progress = 0
         self.current_page = 0
         self.items_per_page = 17  # Increased from 12 to 17 (fits on 480px height)
+        self._total_pages = 0
+        self._cached_ip = None  # Local IP captured when a scan starts
+
+        # Show the previous scan immediately if it's recent and for this network
+        self.cache_file = cache_file
+        self._load_device_cache()
+
+        # Last rendered frame, reused while the visible state is unchanged
+        self._dirty = True
+        self._last_image: Optional[Image.Image] = None
+        self._last_state = None
+
+        # Battery outline + terminal never change, so rasterise them once
+        self._battery_sprite = self._build_battery_sprite()
+
+        # Static chrome (title + instructions) is drawn once and copied per frame
+        self._base_key = None
+        self._base_image = None
+        self._build_base_image()
 
     def start_scan(self):
         """Start network scan in background"""
-        import threading
+        if self.enriching:
+            # The device list shows "looking up names" until the results are saved
+            self.logger.info("Scan requested while looking up device names; ignoring")
+            return
         if not self.scanning:
+            # Network may have changed since last scan - refresh local IP
+            invalidate_ip_cache()
+            self._cached_ip = get_ip_address()
             self.scanning = True
             self.scan_progress = 0
-            self.devices = []
+            self.current_page = 0
+            self._clear_devices()
             thread = threading.Thread(target=self._scan_network, daemon=True)
             thread.start()
 
+    def _load_device_cache(self):
+        """Populate self.devices from the last scan if it is still fresh"""
+        try:
+            if not os.path.exists(self.cache_file):
+                return
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+
+            age = time.time() - data.get('ts', 0)
+            local_ip = get_ip_address()
+            if local_ip == "No Network":
+                return
+            if age < self.DEVICE_CACHE_MAX_AGE and data.get('network') == str(_local_network(local_ip)):
+                self._add_devices(data.get('devices', []))
+                self.logger.info(f"Loaded {len(self._table)} cached devices ({int(age)}s old)")
+        except Exception as e:
+            self.logger.warning(f"Failed to load device cache: {e}")
+
+    def _save_device_cache(self, network: str):
+        """Persist the current scan results for the next startup"""
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(self.cache_file, 'w') as f:
+                json.dump({'network': network, 'ts': time.time(), 'devices': self.devices}, f)
+        except Exception as e:
+            self.logger.warning(f"Failed to save device cache: {e}")
+
     def _scan_network(self):
         """Scan the local network for devices"""
+        network = None
         try:
             # Get local IP and network
-            local_ip = get_ip_address()
+            local_ip = self._cached_ip
             if local_ip == "No Network":
                 self.scanning = False
                 return
 
-            # Extract network prefix (e.g., 192.168.1)
-            ip_parts = local_ip.split('.')
-            network_prefix = '.'.join(ip_parts[:3])
-            network = f"{network_prefix}.0/24"
-
+            network = _local_network(local_ip)
             self.logger.info(f"Scanning network {network}")
 
-            # Try using arp-scan first (much faster)
+            # Ping sweep first: it needs no sudo, and every host that answered
+            # the kernel's ARP requests for it - even ones that drop ICMP -
+            # is left behind in /proc/net/arp
+            self._ping_sweep(network)
+            arp_entries = {ip: mac for ip, mac in _read_proc_arp().items()
+                           if ipaddress.ip_address(ip) in network}
+            self._merge_arp_entries(arp_entries)
+
+            # The ARP cache has a MAC for every host that answered (we never
+            # ARP for ourselves) - no need to fork arp-scan or nmap
+            answered = {d['ip'] for d in self.devices} - {local_ip}
+            if arp_entries and answered <= arp_entries.keys():
+                self.logger.info("Using kernel ARP cache for network discovery")
+                return
+
+            # ARP cache empty or missing hosts - ask arp-scan, then nmap.
+            # Both merge into the devices already listed, so a failure keeps
+            # the ping sweep results on screen
             try:
-                self.scan_progress = 10
                 self.logger.info("Trying arp-scan...")
-                result = subprocess.run(
-                    ['sudo', 'arp-scan', '--localnet', '--interface=wlan0'],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
+                # Runs without sudo: install_dependencies.sh grants the binary
+                # raw socket access with
+                #   sudo setcap cap_net_raw,cap_net_admin+eip $(which arp-scan)
+                # Fewer retries and a bandwidth cap keep it from flooding small
+                # APs; -x drops the header/footer lines
+                returncode, stderr = self._run_streaming(
+                    ['arp-scan', '--localnet', f'--interface={SCAN_INTERFACE}',
+                     '--retry=2', '--bandwidth=256000', '-x'],
+                    timeout=30,
+                    parse=self._parse_arp_scan_output
                 )
 
-                self.logger.info(f"arp-scan return code: {result.returncode}")
-                if result.returncode == 0:
+                self.logger.info(f"arp-scan return code: {returncode}")
+                if returncode == 0:
                     self.logger.info("Using arp-scan for network discovery")
-                    self.logger.debug(f"arp-scan output: {result.stdout}")
-                    self._parse_arp_scan_output(result.stdout)
-                    self.scanning = False
-                    self.scan_progress = 100
                     return
                 else:
-                    self.logger.warning(f"arp-scan failed with stderr: {result.stderr}")
+                    self.logger.warning(f"arp-scan failed with stderr: {stderr.decode(errors='replace')}")
 
             except FileNotFoundError:
                 self.logger.info("arp-scan not installed, falling back to nmap")
@@ -118,44 +453,153 @@ class IPScannerScreen:
 
             # Try nmap as second option
             try:
-                self.scan_progress = 20
                 self.logger.info("Trying nmap...")
-                result = subprocess.run(
-                    ['nmap', '-sn', network],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
+                returncode, stderr = self._run_streaming(
+                    ['nmap', '-sn', str(network)],
+                    timeout=60,
+                    parse=self._parse_nmap_output
                 )
 
-                self.logger.info(f"nmap return code: {result.returncode}")
-                if result.returncode == 0:
+                self.logger.info(f"nmap return code: {returncode}")
+                if returncode == 0:
                     self.logger.info("Using nmap for network discovery")
-                    self.logger.debug(f"nmap output: {result.stdout}")
-                    self._parse_nmap_output(result.stdout)
-                    self.scanning = False
-                    self.scan_progress = 100
                     return
                 else:
-                    self.logger.warning(f"nmap failed with stderr: {result.stderr}")
+                    self.logger.warning(f"nmap failed with stderr: {stderr.decode(errors='replace')}")
 
             except FileNotFoundError:
-                self.logger.info("nmap not installed, falling back to ping sweep")
+                self.logger.info("nmap not installed, using ping sweep results")
             except subprocess.TimeoutExpired:
-                self.logger.warning("nmap timed out, falling back to ping sweep")
+                self.logger.warning("nmap timed out, using ping sweep results")
             except Exception as e:
                 self.logger.error(f"nmap error: {e}", exc_info=True)
 
-            # Fall back to ping sweep (slowest but most reliable)
             self.logger.info("Using ping sweep for network discovery")
-            self._ping_sweep(network_prefix)
 
         except Exception as e:
             self.logger.error(f"Network scan failed: {e}", exc_info=True)
         finally:
+            # Show the device list as soon as discovery is done; hostnames and
+            # port 80 status only feed the web UI, so fill them in afterwards
+            found = network is not None and len(self._table)
+            self.enriching = bool(found)
             self.scanning = False
             self.scan_progress = 100
 
+            if found:
+                try:
+                    self._enrich_devices()
+                    self._save_device_cache(str(network))
+                finally:
+                    self.enriching = False
+
+    def _run_streaming(self, cmd: List[str], timeout: float,
+                       parse: Callable[[Iterable[bytes]], None]) -> Tuple[int, bytes]:
+        """
+        Run cmd and feed its stdout to parse line by line as it is produced
+
+        Returns:
+            (returncode, stderr) - raises subprocess.TimeoutExpired if the
+            command had to be killed after timeout seconds
+        """
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            parse(proc.stdout)
+            proc.wait()
+            stderr = proc.stderr.read()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return proc.returncode, stderr
+
+    def _clear_devices(self):
+        """Forget all discovered devices"""
+        with self._devices_lock:
+            self._table = DeviceTable()
+            self._update_pagination()
+
+    @property
+    def devices(self) -> List[Dict[str, str]]:
+        """Discovered devices as a list of dicts (for the web API and cache)"""
+        with self._devices_lock:
+            table = self._table
+            return [table.as_dict(i) for i in range(len(table))]
+
+    def _append_device(self, ip: str, mac: str = 'Unknown', name: str = 'Unknown'):
+        """
+        Add one discovered device; safe to call from scan worker threads
+
+        A device already listed (e.g. by the ping sweep) gets its MAC and
+        vendor filled in instead of a second row.
+        """
+        with self._devices_lock:
+            table = self._table
+            i = table.index(ip)
+            if i < 0:
+                table.append(ip, mac, name)
+            else:
+                if mac != 'Unknown':
+                    table.set_mac(i, mac)
+                if name != 'Unknown':
+                    table.names[i] = name
+            self._update_pagination()
+
+    def _add_devices(self, devices):
+        """Append discovered devices (dicts) and refresh pagination bounds"""
+        with self._devices_lock:
+            for device in devices:
+                self._table.append(device['ip'], device.get('mac', 'Unknown'), device.get('name', 'Unknown'),
+                                   device.get('hostname', ''), device.get('http', False))
+            self._update_pagination()
+
+    def _merge_arp_entries(self, entries: Dict[str, str]):
+        """Fill in MACs for known devices and add hosts that only answered ARP"""
+        with self._devices_lock:
+            table = self._table
+            for ip, mac in entries.items():
+                i = table.index(ip)
+                if i < 0:
+                    table.append(ip, mac)
+                else:
+                    table.set_mac(i, mac)
+            self._update_pagination()
+
+    def _update_pagination(self):
+        """Recompute the page count after the device table changes (O(1) per append)"""
+        per_page = self.items_per_page
+        self._total_pages = (len(self._table) + per_page - 1) // per_page
+        # Mid-scan only the progress screen is up, and its device count is
+        # redrawn with the next progress step - not one e-paper refresh per host
+        if not self.scanning:
+            self._dirty = True
+
     def _get_hostname(self, ip: str) -> str:
+        """Hostname for an IP address, reusing lookups from recent scans"""
+        now = time.monotonic()
+        cached = _hostname_cache.get(ip)
+        if cached is not None and now - cached[1] < HOSTNAME_CACHE_TTL:
+            return cached[0]
+
+        hostname = self._resolve_hostname(ip)
+        _hostname_cache[ip] = (hostname, now)
+        return hostname
+
+    def _resolve_hostname(self, ip: str) -> str:
         """Resolve hostname for an IP address using multiple methods"""
 
         # Method 1: Try avahi-resolve for mDNS (.local) names
@@ -248,79 +692,141 @@ class IPScannerScreen:
         """Add hostname and port 80 status to all discovered devices"""
         import concurrent.futures
 
-        def enrich_device(device):
-            ip = device['ip']
-            device['hostname'] = self._get_hostname(ip)
-            device['http'] = self._check_port_80(ip)
-            return device
+        table = self._table
+
+        def enrich_device(i):
+            ip = table.ip(i)
+            table.hostnames[i] = self._get_hostname(ip)
+            table.http[i] = 1 if self._check_port_80(ip) else 0
 
         # Enrich devices in parallel for speed (limited workers due to subprocess calls)
         with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(enrich_device, device) for device in self.devices]
+            futures = [executor.submit(enrich_device, i) for i in range(len(table))]
             concurrent.futures.wait(futures)
 
         self.logger.info("Enriched devices with hostname and port 80 status")
 
-    def _parse_arp_scan_output(self, output: str):
-        """Parse arp-scan output"""
-        for line in output.split('\n'):
-            # Skip header and footer lines
-            if '\t' not in line or line.startswith('Interface:') or line.startswith('Starting'):
-                continue
-
-            parts = line.split('\t')
-            if len(parts) >= 2:
-                ip = parts[0].strip()
-                mac = parts[1].strip()
-                # Get manufacturer from third column if available
-                manufacturer = parts[2].strip() if len(parts) >= 3 else "Unknown"
-
-                # Skip invalid IPs
-                if not ip or ip == "0.0.0.0":
+    def _parse_arp_scan_output(self, output: Union[bytes, Iterable[bytes]]):
+        """Parse arp-scan output (whole buffer, or lines as they are produced)"""
+        chunks = (output,) if isinstance(output, bytes) else output
+        lines_seen = 0
+        for chunk in chunks:
+            # Header/footer lines never match the host line pattern
+            for m in _ARP_RE.finditer(chunk):
+                if m[1] == b"0.0.0.0":
                     continue
+                self._append_device(
+                    m[1].decode('ascii'),
+                    m[2].decode('ascii'),
+                    (m[3] or b'').strip().decode('utf-8', 'replace') or "Unknown"
+                )
 
-                self.devices.append({
-                    'ip': ip,
-                    'mac': mac,
-                    'name': manufacturer,
-                    'hostname': '',
-                    'http': False
-                })
+            # Roughly one line per probed host on a /24; carries on from
+            # where the ping sweep left the progress bar
+            lines_seen += 1
+            self.scan_progress = max(self.scan_progress, min(90, 60 + (lines_seen * 30) // 254))
 
-        self.logger.info(f"Found {len(self.devices)} devices via arp-scan")
-        # Enrich with hostname and port 80 check
-        self._enrich_devices()
+        self.logger.info(f"Found {len(self._table)} devices via arp-scan")
 
-    def _parse_nmap_output(self, output: str):
-        """Parse nmap output"""
+    def _parse_nmap_output(self, output: Union[bytes, Iterable[bytes]]):
+        """Parse nmap output (whole buffer, or lines as they are produced)"""
+        chunks = (output,) if isinstance(output, bytes) else output
         current_ip = None
-        for line in output.split('\n'):
-            if 'Nmap scan report for' in line:
-                # Extract IP address
-                parts = line.split()
-                if len(parts) >= 5:
-                    current_ip = parts[-1].strip('()')
-            elif 'MAC Address:' in line and current_ip:
-                # Extract MAC and manufacturer
-                parts = line.split('MAC Address:')[1].strip().split('(')
-                mac = parts[0].strip()
-                manufacturer = parts[1].strip(')') if len(parts) > 1 else "Unknown"
-
-                self.devices.append({
-                    'ip': current_ip,
-                    'mac': mac,
-                    'name': manufacturer,
-                    'hostname': '',
-                    'http': False
-                })
-                current_ip = None
-
-        self.logger.info(f"Found {len(self.devices)} devices via nmap")
-        # Enrich with hostname and port 80 check
-        self._enrich_devices()
-
-    def _ping_sweep(self, network_prefix: str):
-        """Ping sweep fallback method"""
+        hosts_seen = 0
+        for chunk in chunks:
+            for m in _NMAP_RE.finditer(chunk):
+                if m['ip']:
+                    current_ip = m['ip'].decode('ascii')
+                    hosts_seen += 1
+                    self.scan_progress = max(self.scan_progress, min(90, 60 + (hosts_seen * 30) // 254))
+                elif current_ip:
+                    # MAC line belongs to the most recent host report
+                    self._append_device(
+                        current_ip,
+                        m['mac'].decode('ascii'),
+                        m['vendor'].decode('utf-8', 'replace') if m['vendor'] else "Unknown"
+                    )
+                    current_ip = None
+
+        self.logger.info(f"Found {len(self._table)} devices via nmap")
+
+    def _ping_sweep(self, network: ipaddress.IPv4Network):
+        """Ping every host on the network (also primes the kernel ARP cache)"""
+        addresses = list(network.hosts())
+        hosts = [str(addresses[i]) for i in _probe_order(len(addresses))]
+
+        # Prefer a single ICMP socket driven by asyncio; fall back to ping
+        # subprocesses if neither datagram nor raw ICMP sockets are permitted
+        # Both sweeps add hosts to the device table as soon as they answer
+        try:
+            asyncio.run(self._icmp_sweep(hosts))
+            method = "ICMP sweep"
+        except (OSError, AttributeError) as e:
+            self.logger.info(f"ICMP socket unavailable ({e}), falling back to ping subprocesses")
+            # The ICMP sweep may have failed part way - start over so hosts
+            # it already added aren't listed twice
+            self._clear_devices()
+            self._subprocess_ping_sweep(hosts)
+            method = "ping sweep"
+
+        # Hits arrive in probe order; list them by address
+        with self._devices_lock:
+            self._table.sort_by_ip()
+
+        self.logger.info(f"Found {len(self._table)} devices via {method}")
+
+    async def _icmp_sweep(self, hosts: List[str], timeout: float = 1.0) -> List[str]:
+        """Send one ICMP echo to every host and collect replies until timeout"""
+        loop = asyncio.get_running_loop()
+        sock, is_raw = _open_icmp_socket()
+        sock.setblocking(False)
+        # Raw sockets see every ICMP packet on the host, so tag ours
+        ident = os.getpid() & 0xFFFF
+        alive = []
+
+        def handle_reply(data: bytes, addr):
+            if is_raw:
+                # Strip the IPv4 header and ignore other processes' pings
+                data = data[(data[0] & 0x0F) * 4:]
+                if len(data) < 8 or struct.unpack('!H', data[4:6])[0] != ident:
+                    return
+            if data and data[0] == ICMP_ECHO_REPLY and addr[0] not in alive:
+                alive.append(addr[0])
+                self._append_device(addr[0])
+
+        try:
+            for seq, ip in enumerate(hosts, start=1):
+                try:
+                    await loop.sock_sendto(sock, _icmp_echo_packet(seq, ident), (ip, 0))
+                except OSError as e:
+                    # e.g. EHOSTUNREACH for a single address - keep sweeping
+                    self.logger.debug(f"ICMP send to {ip} failed: {e}")
+                self.scan_progress = int((seq / len(hosts)) * 50)
+
+                # Drain replies while sending so a burst can't overflow the receive buffer
+                while True:
+                    try:
+                        handle_reply(*sock.recvfrom(1024))
+                    except (BlockingIOError, InterruptedError):
+                        break
+
+            deadline = loop.time() + timeout
+            while len(alive) < len(hosts):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    handle_reply(*await asyncio.wait_for(loop.sock_recvfrom(sock, 1024), remaining))
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            sock.close()
+
+        self.scan_progress = 60
+        return alive
+
+    def _subprocess_ping_sweep(self, hosts: List[str]) -> List[str]:
+        """Ping each host with the system ping command"""
         import concurrent.futures
 
         def ping_host(ip):
@@ -336,33 +842,22 @@ class IPScannerScreen:
                 pass
             return None
 
-        # Ping all IPs in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=50) as executor:
-            futures = []
-            for i in range(1, 255):
-                ip = f"{network_prefix}.{i}"
-                futures.append(executor.submit(ping_host, ip))
-                self.scan_progress = 20 + int((i / 254) * 80)
-
-            for future in concurrent.futures.as_completed(futures):
-                ip = future.result()
+        # Ping all IPs in parallel; each worker mostly sleeps in ping, so a few
+        # per core is plenty without flooding a Pi Zero with threads
+        alive = []
+        workers = min(32, (os.cpu_count() or 1) * 8)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for done, ip in enumerate(executor.map(ping_host, hosts), start=1):
+                self.scan_progress = int((done / len(hosts)) * 60)
                 if ip:
-                    self.devices.append({
-                        'ip': ip,
-                        'mac': 'Unknown',
-                        'name': 'Unknown',
-                        'hostname': '',
-                        'http': False
-                    })
-
-        self.logger.info(f"Found {len(self.devices)} devices via ping sweep")
-        # Enrich with hostname and port 80 check
-        self._enrich_devices()
+                    alive.append(ip)
+                    self._append_device(ip)
+
+        return alive
 
     def next_page(self):
         """Move to next page"""
-        total_pages = (len(self.devices) + self.items_per_page - 1) // self.items_per_page
-        if self.current_page < total_pages - 1:
+        if self.current_page < self._total_pages - 1:
             self.current_page += 1
 
     def prev_page(self):
@@ -370,33 +865,44 @@ class IPScannerScreen:
         if self.current_page > 0:
             self.current_page -= 1
 
+    def _build_battery_sprite(self) -> Image.Image:
+        """Rasterise the battery outline and terminal into a 1-bit mask"""
+        battery_width = self.BATTERY_WIDTH
+        battery_height = self.BATTERY_HEIGHT
+        terminal_width = 2
+        terminal_height = 6
+
+        sprite = Image.new('1', (battery_width + terminal_width + 1, battery_height + 1), 0)
+        sprite_draw = ImageDraw.Draw(sprite)
+
+        # Battery outline
+        sprite_draw.rectangle(
+            [(0, 0), (battery_width, battery_height)],
+            outline=1,
+            width=2
+        )
+
+        # Battery terminal (small rectangle on right)
+        terminal_y = (battery_height - terminal_height) // 2
+        sprite_draw.rectangle(
+            [(battery_width, terminal_y), (battery_width + terminal_width, terminal_y + terminal_height)],
+            fill=1
+        )
+        return sprite
+
     def _draw_battery_icon(self, draw: ImageDraw.Draw, x: int, y: int, percentage: int, is_charging: bool = False):
         """
         Draw battery icon with percentage and charging indicator
         (Same implementation as MainMenuScreen)
         """
         # Battery body (20x10 rectangle)
-        battery_width = 25
-        battery_height = 12
+        battery_width = self.BATTERY_WIDTH
+        battery_height = self.BATTERY_HEIGHT
         battery_x = x - battery_width - 5
         battery_y = y
 
-        # Draw battery outline
-        draw.rectangle(
-            [(battery_x, battery_y), (battery_x + battery_width, battery_y + battery_height)],
-            outline=0,
-            width=2
-        )
-
-        # Draw battery terminal (small rectangle on right)
-        terminal_width = 2
-        terminal_height = 6
-        terminal_x = battery_x + battery_width
-        terminal_y = battery_y + (battery_height - terminal_height) // 2
-        draw.rectangle(
-            [(terminal_x, terminal_y), (terminal_x + terminal_width, terminal_y + terminal_height)],
-            fill=0
-        )
+        # Stamp the pre-rendered outline and terminal
+        draw.bitmap((battery_x, battery_y), self._battery_sprite, fill=0)
 
         # Fill battery based on percentage
         if percentage > 0:
@@ -411,58 +917,113 @@ class IPScannerScreen:
         if is_charging:
             bolt_center_x = battery_x + battery_width // 2
             bolt_center_y = battery_y + battery_height // 2
-            # Larger, more visible lightning bolt
-            bolt_points = [
-                (bolt_center_x + 2, bolt_center_y - 6),    # Top tip
-                (bolt_center_x - 2, bolt_center_y - 1),    # Upper left
-                (bolt_center_x + 3, bolt_center_y - 1),    # Upper right
-                (bolt_center_x - 2, bolt_center_y + 6),    # Bottom tip
-                (bolt_center_x + 2, bolt_center_y + 1),    # Lower right
-                (bolt_center_x - 3, bolt_center_y + 1),    # Lower left
-            ]
+            bolt_points = [(bolt_center_x + dx, bolt_center_y + dy) for dx, dy in self.BOLT_OFFSETS]
             # Draw white bolt with black outline for visibility
             draw.polygon(bolt_points, fill=1, outline=0)
 
         # Draw percentage text to the left
         percentage_text = f"{percentage}%"
-        font = ImageFont.load_default()
+        font = get_default_font()
         try:
-            bbox = draw.textbbox((0, 0), percentage_text, font=font)
-            text_width = bbox[2] - bbox[0]
+            pct_width = text_width(font, percentage_text)
         except:
-            text_width = len(percentage_text) * 8
+            pct_width = len(percentage_text) * 8
 
-        text_x = battery_x - text_width - 5
+        text_x = battery_x - pct_width - 5
         draw.text((text_x, y), percentage_text, font=font, fill=0)
 
-    def render(self) -> Image.Image:
-        """
-        Render the IP scanner screen
-
-        Returns:
-            PIL Image of the screen
-        """
-        # Create image
+    def _build_base_image(self):
+        """Pre-render the static title and instruction bar"""
         image = Image.new('L', (self.width, self.height), 255)
         draw = ImageDraw.Draw(image)
 
         # Draw title
         title = "Network Scanner"
-        title_bbox = draw.textbbox((0, 0), title, font=self.title_font)
-        title_width = title_bbox[2] - title_bbox[0]
+        title_width = text_width(self.title_font, title)
         draw.text(((self.width - title_width) // 2, 10), title, font=self.title_font, fill=0)
 
-        # Draw battery status if available
+        # Draw instructions
+        instruction = "SELECT: Scan | NEXT/PREV: Page | HOLD GPIO5: Menu"
+        try:
+            instr_width = text_width(self.small_font, instruction)
+        except:
+            instr_width = len(instruction) * 7
+
+        instr_x = (self.width - instr_width) // 2
+        draw.text((instr_x, self.height - 30), instruction, font=self.small_font, fill=0)
+
+        self._base_image = image
+        self._base_key = (self.width, self.height, self.font_size)
+
+    def _frame_state(self):
+        """
+        Gather the inputs a frame depends on
+
+        Returns:
+            (battery, local_ip, state) - state is the fingerprint compared
+            against the last rendered frame
+        """
+        # Battery status is read up front - it is part of the fingerprint
+        battery = None
         if self.battery_monitor:
             try:
-                battery_pct = self.battery_monitor.get_percentage()
-                charging = self.battery_monitor.is_charging()
-                self._draw_battery_icon(draw, self.width - 10, 10, battery_pct, charging)
+                battery = (self.battery_monitor.get_percentage(), self.battery_monitor.is_charging())
             except Exception as e:
                 self.logger.warning(f"Failed to get battery status: {e}")
 
+        # Local IP is pinned for the duration of a scan, TTL-cached otherwise
+        local_ip = self._cached_ip if self.scanning else get_ip_address()
+
+        # The device count only forces a redraw once the list is showing
+        count = None if self.scanning else len(self._table)
+        state = (self.scanning, self.scan_progress, self.current_page, count, battery, local_ip,
+                 self.width, self.height, self.font_size, self.enriching)
+        return battery, local_ip, state
+
+    def needs_render(self) -> bool:
+        """
+        Whether a periodic refresh would show anything worth an e-paper update
+
+        Devices, pages, battery and scan state changes always count; scan
+        progress only counts once it has moved into a new 5% step, and
+        devices found mid-scan wait for that step too.
+        """
+        if self._dirty or self._last_state is None:
+            return True
+
+        state = self._frame_state()[2]
+        last = self._last_state
+        return (state[0] != last[0]
+                or state[1] // self.PROGRESS_REDRAW_STEP != last[1] // self.PROGRESS_REDRAW_STEP
+                or state[2:] != last[2:])
+
+    def render(self) -> Image.Image:
+        """
+        Render the IP scanner screen
+
+        Returns:
+            PIL Image of the screen (a new image per frame - later renders
+            never draw into it, so it is safe to hand to another thread)
+        """
+        battery, local_ip, state = self._frame_state()
+
+        # Nothing visible changed since the last frame - reuse it
+        table = self._table
+        if not self._dirty and self._last_image is not None and state == self._last_state:
+            return self._last_image
+
+        # Start from a copy of the cached static chrome (rebuilt if
+        # geometry/font changed)
+        if self._base_key != (self.width, self.height, self.font_size):
+            self._build_base_image()
+        image = self._base_image.copy()
+        draw = ImageDraw.Draw(image)
+
+        # Draw battery status if available
+        if battery is not None:
+            self._draw_battery_icon(draw, self.width - 10, 10, battery[0], battery[1])
+
         # Draw local IP
-        local_ip = get_ip_address()
         ip_text = f"Your IP: {local_ip}"
         draw.text((10, 45), ip_text, font=self.font, fill=0)
 
@@ -470,8 +1031,10 @@ class IPScannerScreen:
         y_offset = 75
 
         if self.scanning:
-            # Show scanning progress
+            # Show scanning progress (devices stream in while the scan runs)
             status_text = f"Scanning... {self.scan_progress}%"
+            if len(table):
+                status_text += f" - {len(table)} found"
             draw.text((10, y_offset), status_text, font=self.font, fill=0)
 
             # Draw progress bar
@@ -495,50 +1058,42 @@ class IPScannerScreen:
                     fill=0
                 )
 
-        elif len(self.devices) == 0:
+        elif len(table) == 0:
             # No devices found
             message = "No devices found. Press SELECT to scan."
-            msg_bbox = draw.textbbox((0, 0), message, font=self.font)
-            msg_width = msg_bbox[2] - msg_bbox[0]
+            msg_width = text_width(self.font, message)
             draw.text(((self.width - msg_width) // 2, self.height // 2), message, font=self.font, fill=0)
 
         else:
             # Display devices
-            devices_text = f"Found {len(self.devices)} device(s):"
+            devices_text = f"Found {len(table)} device(s):"
+            if self.enriching:
+                # Say why SELECT does nothing until the lookups are done
+                devices_text = f"Found {len(table)} device(s) - looking up names..."
             draw.text((10, y_offset), devices_text, font=self.font, fill=0)
             y_offset += 30
 
-            # Calculate pagination
-            start_idx = self.current_page * self.items_per_page
-            end_idx = min(start_idx + self.items_per_page, len(self.devices))
+            # Rows for this page (empty if the table shrank under a stale page)
+            start = self.current_page * self.items_per_page
+            page_range = range(start, min(start + self.items_per_page, len(table)))
 
-            # Draw device list
-            for i in range(start_idx, end_idx):
-                device = self.devices[i]
-                device_text = f"{device['ip']}"
-                if device['name'] != 'Unknown':
-                    device_text += f" - {device['name']}"
+            # Draw device list straight from the table columns
+            for i in page_range:
+                device_text = table.ip(i)
+                name = table.names[i]
+                if name != 'Unknown':
+                    device_text += f" - {name}"
 
                 draw.text((20, y_offset), device_text, font=self.small_font, fill=0)
                 y_offset += 22
 
             # Draw page indicator if multiple pages
-            total_pages = (len(self.devices) + self.items_per_page - 1) // self.items_per_page
-            if total_pages > 1:
-                page_text = f"Page {self.current_page + 1}/{total_pages}"
-                page_bbox = draw.textbbox((0, 0), page_text, font=self.small_font)
-                page_width = page_bbox[2] - page_bbox[0]
+            if self._total_pages > 1:
+                page_text = f"Page {self.current_page + 1}/{self._total_pages}"
+                page_width = text_width(self.small_font, page_text)
                 draw.text(((self.width - page_width) // 2, self.height - 50), page_text, font=self.small_font, fill=0)
 
-        # Draw instructions
-        instruction = "SELECT: Scan | NEXT/PREV: Page | HOLD GPIO5: Menu"
-        try:
-            instr_bbox = draw.textbbox((0, 0), instruction, font=self.small_font)
-            instr_width = instr_bbox[2] - instr_bbox[0]
-        except:
-            instr_width = len(instruction) * 7
-
-        instr_x = (self.width - instr_width) // 2
-        draw.text((instr_x, self.height - 30), instruction, font=self.small_font, fill=0)
-
+        self._last_image = image
+        self._last_state = state
+        self._dirty = False
         return image
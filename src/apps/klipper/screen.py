@@ -4,13 +4,122 @@ Klipper Screen
 E-ink display screen for discovering and monitoring Klipper/MainsailOS 3D printers.
 """
 
+import asyncio
+import concurrent.futures
+import http.client
 import logging
+import math
+import os
 import socket
 import subprocess
-import urllib.request
+import threading
+import time
 import json
-from typing import List, Dict, Optional
-from PIL import Image, ImageDraw, ImageFont
+from array import array
+from typing import List, Dict, Optional, Tuple
+from PIL import Image, ImageDraw
+
+from src.utils.fonts import get_font, get_default_font, text_width
+
+# Optional: faster JSON decoding (requires orjson); both parse bytes directly
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Moonraker API port, probed to discover Klipper printers
+MOONRAKER_PORT = 7125
+
+# mDNS service type Moonraker advertises when its [zeroconf] component is on
+MDNS_SERVICE = '_moonraker._tcp'
+
+# Printers rarely change IP, so the last ones found are re-probed with a
+# short connect timeout and kept even if mDNS no longer lists them
+KNOWN_PROBE_TIMEOUT = 0.25  # seconds
+
+# Printer hostnames rarely change; re-resolve them at most this often
+HOSTNAME_CACHE_TTL = 900  # seconds
+
+# Everything the screen shows, fetched in a single Moonraker request
+STATUS_QUERY = "/printer/objects/query?webhooks&extruder&heater_bed&print_stats&virtual_sdcard"
+
+# print_stats states that override the Klippy state, and the name shown for each
+_STATE_MAP = {
+    'printing': 'printing',
+    'complete': 'complete',
+    'standby': 'ready',
+    'paused': 'paused',
+}
+
+
+class PrinterTable:
+    """
+    Known printers stored column-wise instead of one dict per printer
+
+    Temperatures and progress are packed into float arrays; NaN means the
+    printer didn't report that value.
+    """
+
+    __slots__ = ('ips', 'hostnames', 'states', 'klipper_versions', 'filenames',
+                 'extruder_temps', 'extruder_targets', 'bed_temps', 'bed_targets', 'progress')
+
+    # Float columns and the printer-info keys they hold
+    FLOAT_COLUMNS = (
+        ('extruder_temps', 'extruder_temp'),
+        ('extruder_targets', 'extruder_target'),
+        ('bed_temps', 'bed_temp'),
+        ('bed_targets', 'bed_target'),
+        ('progress', 'progress'),
+    )
+
+    def __init__(self):
+        self.ips: List[str] = []
+        self.hostnames: List[str] = []
+        self.states: List[str] = []
+        self.klipper_versions: List[Optional[str]] = []
+        self.filenames: List[Optional[str]] = []
+        for column, _ in self.FLOAT_COLUMNS:
+            setattr(self, column, array('d'))
+
+    def __len__(self) -> int:
+        return len(self.ips)
+
+    def append(self, info: Dict):
+        """Add a printer from the dict built by _get_printer_info"""
+        self.ips.append(info['ip'])
+        self.hostnames.append(info['hostname'])
+        self.states.append(info['state'])
+        self.klipper_versions.append(info['klipper_version'])
+        self.filenames.append(info['filename'])
+        for column, key in self.FLOAT_COLUMNS:
+            value = info[key]
+            getattr(self, column).append(math.nan if value is None else value)
+
+    def update(self, i: int, info: Dict):
+        """Overwrite printer i with freshly polled info"""
+        self.ips[i] = info['ip']
+        self.hostnames[i] = info['hostname']
+        self.states[i] = info['state']
+        self.klipper_versions[i] = info['klipper_version']
+        self.filenames[i] = info['filename']
+        for column, key in self.FLOAT_COLUMNS:
+            value = info[key]
+            getattr(self, column)[i] = math.nan if value is None else value
+
+    def as_dict(self, i: int) -> Dict:
+        """Printer i in the dict form returned by get_selected_printer()"""
+        info = {
+            'ip': self.ips[i],
+            'hostname': self.hostnames[i],
+            'state': self.states[i],
+            'klipper_version': self.klipper_versions[i],
+            'filename': self.filenames[i],
+        }
+        for column, key in self.FLOAT_COLUMNS:
+            value = getattr(self, column)[i]
+            info[key] = None if math.isnan(value) else value
+        return info
 
 
 class KlipperScreen:
@@ -18,7 +127,8 @@ class KlipperScreen:
     Klipper screen - discovers and monitors 3D printers running Klipper/MainsailOS
     """
 
-    def __init__(self, width: int = 800, height: int = 480, font_size: int = 18, battery_monitor=None):
+    def __init__(self, width: int = 800, height: int = 480, font_size: int = 18, battery_monitor=None,
+                 known_file: str = "data/klipper_known.json"):
         """
         Initialize Klipper screen
 
@@ -27,6 +137,7 @@ class KlipperScreen:
             height: Screen height
             font_size: Base font size
             battery_monitor: Optional BatteryMonitor instance
+            known_file: Path to JSON file holding the printer IPs found last time
         """
         self.width = width
         self.height = height
@@ -36,18 +147,19 @@ class KlipperScreen:
 
         # Load fonts
         try:
-            self.font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-            self.title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-            self.small_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-            self.large_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
+            self.font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
+            self.title_font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
+            self.small_font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
+            self.large_font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
         except:
-            self.font = ImageFont.load_default()
-            self.title_font = ImageFont.load_default()
-            self.small_font = ImageFont.load_default()
-            self.large_font = ImageFont.load_default()
+            self.font = get_default_font()
+            self.title_font = get_default_font()
+            self.small_font = get_default_font()
+            self.large_font = get_default_font()
 
         # Scan state
-        self.printers: List[Dict] = []
+        self._table = PrinterTable()
+        self._table_version = 0  # Bumped on every printer change, for frame reuse
         self.scanning = False
         self.scan_progress = 0
         self.current_index = 0  # Currently selected printer
@@ -59,26 +171,141 @@ class KlipperScreen:
         self.refreshing: bool = False            # True while background status refresh is running
         self.STATUS_REFRESH_INTERVAL: int = 180 # 3 minutes
 
+        # ip -> (hostname, monotonic time resolved); misses are cached too
+        self._hostname_cache: Dict[str, Tuple[str, float]] = {}
+
+        # Battery icon masks, keyed by (percentage, charging)
+        self._battery_cache: Dict[Tuple[int, bool], Tuple[Image.Image, int, int]] = {}
+
+        # Static chrome and the last frame, reused while nothing changes
+        self._base_key = None
+        self._last_image: Optional[Image.Image] = None
+        self._last_state = None
+
+        # Idle keep-alive connections to Moonraker, per printer IP
+        self._connections: Dict[str, List[http.client.HTTPConnection]] = {}
+        self._connections_lock = threading.Lock()
+
+        # Printer IPs from the last full discovery, probed first on rescans
+        self.known_file = known_file
+        self._known_network: Optional[str] = None
+        self._known_ips: List[str] = []
+        self._load_known_ips()
+
+    def _load_known_ips(self):
+        """Read the printer IPs saved by the last full discovery"""
+        try:
+            if not os.path.exists(self.known_file):
+                return
+            with open(self.known_file, 'r') as f:
+                data = json.load(f)
+            self._known_network = data.get('network')
+            self._known_ips = list(data.get('ips', []))
+        except Exception as e:
+            self.logger.warning(f"Failed to load known Klipper printers: {e}")
+
+    def _save_known_ips(self, network: str, ips: List[str]):
+        """Remember the printer IPs found by a full discovery"""
+        self._known_network = network
+        self._known_ips = list(ips)
+        try:
+            known_dir = os.path.dirname(self.known_file)
+            if known_dir:
+                os.makedirs(known_dir, exist_ok=True)
+            with open(self.known_file, 'w') as f:
+                json.dump({'network': network, 'ips': self._known_ips}, f)
+        except Exception as e:
+            self.logger.warning(f"Failed to save known Klipper printers: {e}")
+
+    @property
+    def printers(self) -> List[Dict]:
+        """Known printers as a list of dicts"""
+        table = self._table
+        return [table.as_dict(i) for i in range(len(table))]
+
+    @property
+    def printer_count(self) -> int:
+        """Number of known printers, without building the dict list"""
+        return len(self._table)
+
+    def _add_printer(self, info: Dict):
+        """Append a newly found printer"""
+        self._table.append(info)
+        self._table_version += 1
+
+    def _update_printer(self, index: int, info: Dict):
+        """Replace printer index with freshly polled info"""
+        self._table.update(index, info)
+        self._table_version += 1
+
     def start_scan(self):
         """Start scanning for Klipper printers in background"""
-        import threading
         if not self.scanning:
             self.scanning = True
             self.scan_progress = 0
-            self.printers = []
+            self._table = PrinterTable()
+            self._table_version += 1
+            self._close_connections()
             thread = threading.Thread(target=self._scan_for_printers, daemon=True)
             thread.start()
 
-    def _check_port(self, ip: str, port: int, timeout: float = 1) -> bool:
-        """Check if a port is open on the given IP"""
+    def _browse_mdns(self) -> List[str]:
+        """
+        Find printers advertising _moonraker._tcp via avahi-browse
+
+        Hostnames from the answers go straight into the hostname cache.
+        Returns an empty list if avahi is unavailable or nothing answered.
+        """
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((ip, port))
-            sock.close()
-            return result == 0
-        except:
-            return False
+            result = subprocess.run(
+                ['avahi-browse', '--resolve', '--parsable', '--terminate', MDNS_SERVICE],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            self.logger.debug(f"avahi-browse unavailable: {e}")
+            return []
+
+        found_ips = []
+        now = time.monotonic()
+        for line in result.stdout.splitlines():
+            # =;iface;protocol;name;type;domain;hostname;address;port;txt
+            fields = line.split(';')
+            if len(fields) < 9 or fields[0] != '=' or fields[2] != 'IPv4':
+                continue
+            hostname, ip = fields[6], fields[7]
+            if ip not in found_ips:
+                found_ips.append(ip)
+                self._hostname_cache[ip] = (hostname, now)
+                self.logger.info(f"Found Klipper at {ip} via mDNS")
+        return found_ips
+
+    async def _probe_hosts(self, hosts: List[str], port: int, timeout: float,
+                           report_progress: bool = True) -> List[str]:
+        """Try a TCP connect to port on every host concurrently; return the ones that accept"""
+
+        async def probe(ip):
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+            except (OSError, asyncio.TimeoutError):
+                return None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            return ip
+
+        found_ips = []
+        for completed, result in enumerate(asyncio.as_completed([probe(ip) for ip in hosts]), start=1):
+            ip = await result
+            if report_progress:
+                self.scan_progress = 5 + int((completed / len(hosts)) * 70)
+            if ip:
+                found_ips.append(ip)
+                self.logger.info(f"Found Klipper at {ip}")
+        return found_ips
 
     def _get_local_ip(self) -> str:
         """Get the Pi's local IP address"""
@@ -106,40 +333,37 @@ class KlipperScreen:
             self.logger.info(f"Scanning for Klipper printers on {network_prefix}.0/24")
             self.scan_progress = 5
 
-            # Scan all IPs for port 7125 (Moonraker API)
-            import concurrent.futures
-
-            def check_klipper(ip):
-                # Check for Moonraker API port
-                if self._check_port(ip, 7125, timeout=0.5):
-                    return ip
-                return None
-
-            found_ips = []
-            with concurrent.futures.ThreadPoolExecutor(max_workers=50) as executor:
-                futures = {}
-                for i in range(1, 255):
-                    ip = f"{network_prefix}.{i}"
-                    futures[executor.submit(check_klipper, ip)] = ip
-
-                completed = 0
-                for future in concurrent.futures.as_completed(futures):
-                    completed += 1
-                    self.scan_progress = 5 + int((completed / 254) * 70)
-                    ip = future.result()
-                    if ip:
-                        found_ips.append(ip)
-                        self.logger.info(f"Found Klipper at {ip}")
-
-            # Get detailed info for each printer
+            # Printers from last time still answer on their old IP even if
+            # mDNS misses them; discovery below always runs to find new ones
+            known_found = []
+            known_ips = self._known_ips
+            if known_ips and self._known_network == network_prefix:
+                known_found = asyncio.run(self._probe_hosts(known_ips, MOONRAKER_PORT, timeout=KNOWN_PROBE_TIMEOUT,
+                                                            report_progress=False))
+                self.logger.info(f"{len(known_found)} of {len(known_ips)} known printer(s) answered")
+
+            # Printers that advertise Moonraker over mDNS answer in one query
+            found_ips = self._browse_mdns()
+            if found_ips:
+                self.scan_progress = 75
+            else:
+                # Probe every IP for port 7125 (Moonraker API) from one event loop
+                hosts = [f"{network_prefix}.{i}" for i in range(1, 255)]
+                found_ips = asyncio.run(self._probe_hosts(hosts, MOONRAKER_PORT, timeout=0.5))
+            found_ips += [ip for ip in known_found if ip not in found_ips]
+            self._save_known_ips(network_prefix, found_ips)
+
+            # Get detailed info for every printer at once, so an unresponsive
+            # one only costs its own timeout rather than delaying the rest
             self.scan_progress = 80
-            for i, ip in enumerate(found_ips):
-                printer_info = self._get_printer_info(ip)
-                if printer_info:
-                    self.printers.append(printer_info)
-                self.scan_progress = 80 + int(((i + 1) / len(found_ips)) * 20) if found_ips else 100
+            if found_ips:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(found_ips))) as executor:
+                    for i, printer_info in enumerate(executor.map(self._get_printer_info, found_ips)):
+                        if printer_info:
+                            self._add_printer(printer_info)
+                        self.scan_progress = 80 + int(((i + 1) / len(found_ips)) * 20)
 
-            self.logger.info(f"Found {len(self.printers)} Klipper printers")
+            self.logger.info(f"Found {len(self._table)} Klipper printers")
 
         except Exception as e:
             self.logger.error(f"Klipper scan failed: {e}", exc_info=True)
@@ -148,7 +372,18 @@ class KlipperScreen:
             self.scan_progress = 100
 
     def _get_hostname(self, ip: str) -> str:
-        """Get hostname for an IP using avahi-resolve"""
+        """Get hostname for an IP, reusing lookups from the last HOSTNAME_CACHE_TTL seconds"""
+        now = time.monotonic()
+        cached = self._hostname_cache.get(ip)
+        if cached is not None and now - cached[1] < HOSTNAME_CACHE_TTL:
+            return cached[0]
+
+        hostname = self._resolve_hostname(ip)
+        self._hostname_cache[ip] = (hostname, now)
+        return hostname
+
+    def _resolve_hostname(self, ip: str) -> str:
+        """Get hostname for an IP using avahi-resolve, then reverse DNS"""
         try:
             result = subprocess.run(
                 ['avahi-resolve', '-a', ip],
@@ -162,17 +397,73 @@ class KlipperScreen:
                     return parts[1].strip()
         except:
             pass
+
+        try:
+            hostname = socket.gethostbyaddr(ip)[0]
+            if hostname and hostname != ip:
+                return hostname
+        except (socket.herror, socket.gaierror, socket.timeout):
+            pass
         return ""
 
+    def _get_json(self, ip: str, path: str, timeout: float = 3) -> Dict:
+        """
+        GET a Moonraker endpoint and decode the JSON body
+
+        Reuses an idle keep-alive connection to the printer when there is
+        one, so repeated polls skip the TCP handshake. Raises OSError,
+        http.client.HTTPException or ValueError on failure.
+        """
+        with self._connections_lock:
+            idle = self._connections.get(ip)
+            conn = idle.pop() if idle else None
+
+        response = None
+        if conn is not None:
+            try:
+                response = self._send_get(conn, ip, path)
+            except (OSError, http.client.HTTPException):
+                # Moonraker may have closed the idle connection - retry fresh
+                response = None
+        if response is None:
+            response = self._send_get(http.client.HTTPConnection(ip, MOONRAKER_PORT, timeout=timeout), ip, path)
+
+        status, body = response
+        if status != 200:
+            raise http.client.HTTPException(f"HTTP {status} for {path}")
+        return _json_loads(body)
+
+    def _send_get(self, conn: http.client.HTTPConnection, ip: str, path: str):
+        """Send one GET on conn, then hand the connection back to the idle pool"""
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            body = response.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            with self._connections_lock:
+                self._connections.setdefault(ip, []).append(conn)
+        return response.status, body
+
+    def _close_connections(self):
+        """Drop all idle Moonraker connections"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, {}
+        for idle in connections.values():
+            for conn in idle:
+                conn.close()
+
     def _get_printer_info(self, ip: str) -> Optional[Dict]:
         """Get detailed printer info from Moonraker API"""
         try:
-            base_url = f"http://{ip}:7125"
-            hostname = self._get_hostname(ip)
-
             printer_info = {
                 'ip': ip,
-                'hostname': hostname or ip,
+                'hostname': ip,
                 'state': 'unknown',
                 'klipper_version': None,
                 'extruder_temp': None,
@@ -183,63 +474,11 @@ class KlipperScreen:
                 'filename': None
             }
 
-            # Get server info
-            try:
-                req = urllib.request.Request(f"{base_url}/server/info", method='GET')
-                with urllib.request.urlopen(req, timeout=3) as response:
-                    data = json.loads(response.read().decode())
-                    if 'result' in data:
-                        printer_info['klipper_version'] = data['result'].get('klippy_state', 'unknown')
-            except Exception as e:
-                self.logger.debug(f"Failed to get server info from {ip}: {e}")
-
-            # Get printer state
-            try:
-                req = urllib.request.Request(f"{base_url}/printer/info", method='GET')
-                with urllib.request.urlopen(req, timeout=3) as response:
-                    data = json.loads(response.read().decode())
-                    if 'result' in data:
-                        printer_info['state'] = data['result'].get('state', 'unknown')
-            except Exception as e:
-                self.logger.debug(f"Failed to get printer info from {ip}: {e}")
-
-            # Get temperature and print status
-            try:
-                req = urllib.request.Request(
-                    f"{base_url}/printer/objects/query?extruder&heater_bed&print_stats&virtual_sdcard",
-                    method='GET'
-                )
-                with urllib.request.urlopen(req, timeout=3) as response:
-                    data = json.loads(response.read().decode())
-                    if 'result' in data and 'status' in data['result']:
-                        status = data['result']['status']
-
-                        if 'extruder' in status:
-                            printer_info['extruder_temp'] = status['extruder'].get('temperature', 0)
-                            printer_info['extruder_target'] = status['extruder'].get('target', 0)
-
-                        if 'heater_bed' in status:
-                            printer_info['bed_temp'] = status['heater_bed'].get('temperature', 0)
-                            printer_info['bed_target'] = status['heater_bed'].get('target', 0)
-
-                        if 'print_stats' in status:
-                            print_stats = status['print_stats']
-                            state = print_stats.get('state', '')
-                            if state == 'printing':
-                                printer_info['state'] = 'printing'
-                                printer_info['filename'] = print_stats.get('filename', '')
-                            elif state == 'complete':
-                                printer_info['state'] = 'complete'
-                            elif state == 'standby':
-                                printer_info['state'] = 'ready'
-                            elif state == 'paused':
-                                printer_info['state'] = 'paused'
-
-                        if 'virtual_sdcard' in status:
-                            printer_info['progress'] = status['virtual_sdcard'].get('progress', 0)
-
-            except Exception as e:
-                self.logger.debug(f"Failed to get temperature data from {ip}: {e}")
+            # Resolve the hostname while the status query is in flight
+            fetchers = (self._fetch_hostname, self._fetch_status_objects)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                for fragment in executor.map(lambda fetch: fetch(ip), fetchers):
+                    printer_info.update(fragment)
 
             return printer_info
 
@@ -247,13 +486,70 @@ class KlipperScreen:
             self.logger.error(f"Failed to get Klipper info from {ip}: {e}")
             return None
 
+    def _fetch_hostname(self, ip: str) -> Dict:
+        """Hostname via avahi, if it resolves"""
+        hostname = self._get_hostname(ip)
+        return {'hostname': hostname} if hostname else {}
+
+    def _fetch_server_info(self, ip: str) -> Dict:
+        """Klippy state from /server/info (answers even when Klippy is down)"""
+        try:
+            data = self._get_json(ip, "/server/info")
+            if 'result' in data:
+                state = data['result'].get('klippy_state', 'unknown')
+                return {'klipper_version': state, 'state': state}
+        except Exception as e:
+            self.logger.debug(f"Failed to get server info from {ip}: {e}")
+        return {}
+
+    def _fetch_status_objects(self, ip: str) -> Dict:
+        """Klippy state, temperatures and print status in one /printer/objects/query"""
+        fragment = {}
+        try:
+            data = self._get_json(ip, STATUS_QUERY)
+            if 'result' in data and 'status' in data['result']:
+                status = data['result']['status']
+
+                # webhooks carries the Klippy state that /server/info and
+                # /printer/info would otherwise need their own requests for
+                if 'webhooks' in status:
+                    klippy_state = status['webhooks'].get('state', 'unknown')
+                    fragment['klipper_version'] = klippy_state
+                    fragment['state'] = klippy_state
+
+                if 'extruder' in status:
+                    fragment['extruder_temp'] = status['extruder'].get('temperature', 0)
+                    fragment['extruder_target'] = status['extruder'].get('target', 0)
+
+                if 'heater_bed' in status:
+                    fragment['bed_temp'] = status['heater_bed'].get('temperature', 0)
+                    fragment['bed_target'] = status['heater_bed'].get('target', 0)
+
+                if 'print_stats' in status:
+                    print_stats = status['print_stats']
+                    state = print_stats.get('state', '')
+                    new_state = _STATE_MAP.get(state)
+                    if new_state:
+                        fragment['state'] = new_state
+                    if state == 'printing':
+                        fragment['filename'] = print_stats.get('filename', '')
+
+                if 'virtual_sdcard' in status:
+                    fragment['progress'] = status['virtual_sdcard'].get('progress', 0)
+
+        except Exception as e:
+            # Moonraker rejects object queries while Klippy is disconnected
+            self.logger.debug(f"Failed to query printer objects from {ip}: {e}")
+            return self._fetch_server_info(ip)
+        return fragment
+
     def refresh_printer(self, index: int):
         """Refresh info for a specific printer"""
-        if 0 <= index < len(self.printers):
-            ip = self.printers[index]['ip']
+        if 0 <= index < len(self._table):
+            ip = self._table.ips[index]
             new_info = self._get_printer_info(ip)
             if new_info:
-                self.printers[index] = new_info
+                self._update_printer(index, new_info)
 
     def refresh_all_printers(self):
         """
@@ -261,20 +557,18 @@ class KlipperScreen:
         Only polls temperatures/print-state — does not re-scan the network.
         Updates last_status_refresh when done.
         """
-        import threading
-        if self.refreshing or self.scanning or not self.printers:
+        if self.refreshing or self.scanning or not len(self._table):
             return
 
         def _do_refresh():
             import time as _time
             self.refreshing = True
-            self.logger.info(f"Auto-refreshing status for {len(self.printers)} Klipper printer(s)")
+            self.logger.info(f"Auto-refreshing status for {len(self._table)} Klipper printer(s)")
             try:
-                for i in range(len(self.printers)):
-                    ip = self.printers[i]['ip']
+                for i, ip in enumerate(list(self._table.ips)):
                     new_info = self._get_printer_info(ip)
                     if new_info:
-                        self.printers[i] = new_info
+                        self._update_printer(i, new_info)
             except Exception as e:
                 self.logger.error(f"Klipper auto-refresh error: {e}")
             finally:
@@ -286,46 +580,75 @@ class KlipperScreen:
 
     def next_item(self):
         """Move to next printer"""
-        if len(self.printers) > 0:
-            self.current_index = (self.current_index + 1) % len(self.printers)
+        if len(self._table) > 0:
+            self.current_index = (self.current_index + 1) % len(self._table)
 
     def prev_item(self):
         """Move to previous printer"""
-        if len(self.printers) > 0:
-            self.current_index = (self.current_index - 1) % len(self.printers)
+        if len(self._table) > 0:
+            self.current_index = (self.current_index - 1) % len(self._table)
 
     def next_page(self):
         """Move to next page of printers"""
-        if len(self.printers) > self.items_per_page:
-            total_pages = (len(self.printers) + self.items_per_page - 1) // self.items_per_page
+        if len(self._table) > self.items_per_page:
+            total_pages = (len(self._table) + self.items_per_page - 1) // self.items_per_page
             current_page = self.current_index // self.items_per_page
             next_page = (current_page + 1) % total_pages
             self.current_index = next_page * self.items_per_page
 
     def prev_page(self):
         """Move to previous page of printers"""
-        if len(self.printers) > self.items_per_page:
-            total_pages = (len(self.printers) + self.items_per_page - 1) // self.items_per_page
+        if len(self._table) > self.items_per_page:
+            total_pages = (len(self._table) + self.items_per_page - 1) // self.items_per_page
             current_page = self.current_index // self.items_per_page
             prev_page = (current_page - 1) % total_pages
             self.current_index = prev_page * self.items_per_page
 
     def get_selected_printer(self) -> Optional[Dict]:
         """Get currently selected printer"""
-        if 0 <= self.current_index < len(self.printers):
-            return self.printers[self.current_index]
+        if 0 <= self.current_index < len(self._table):
+            return self._table.as_dict(self.current_index)
         return None
 
     def _draw_battery_icon(self, draw: ImageDraw.Draw, x: int, y: int, percentage: int, is_charging: bool = False):
-        """Draw battery icon with percentage"""
+        """Draw battery icon with percentage, from a sprite cached per (percentage, charging)"""
+        key = (percentage, is_charging)
+        cached = self._battery_cache.get(key)
+        if cached is None:
+            cached = self._battery_cache[key] = self._render_battery_sprite(percentage, is_charging)
+        sprite, dx, dy = cached
+        draw.bitmap((x + dx, y + dy), sprite, fill=0)
+
+    def _render_battery_sprite(self, percentage: int, is_charging: bool) -> Tuple[Image.Image, int, int]:
+        """
+        Rasterize the battery icon into a 1-bit mask (set pixels = ink)
+
+        Returns the mask cropped to its ink and its offset from the (x, y)
+        that _draw_battery_icon is called with.
+        """
+        font = get_default_font()
+        percentage_text = f"{percentage}%"
+        try:
+            pct_width = text_width(font, percentage_text, '1')
+        except:
+            pct_width = len(percentage_text) * 8
+
+        # Draw with inverted colours on a scratch canvas anchored at (x, y)
         battery_width = 25
         battery_height = 12
+        margin = 10
+        x = pct_width + battery_width + 2 * margin
+        y = margin
+        sprite = Image.new('1', (x + margin, battery_height + 3 * margin), 0)
+        draw = ImageDraw.Draw(sprite)
+        ink, paper = 1, 0
+
         battery_x = x - battery_width - 5
         battery_y = y
 
         draw.rectangle(
             [(battery_x, battery_y), (battery_x + battery_width, battery_y + battery_height)],
-            outline=0,
+            outline=ink,
             width=2
         )
 
@@ -335,7 +658,7 @@ class KlipperScreen:
         terminal_y = battery_y + (battery_height - terminal_height) // 2
         draw.rectangle(
             [(terminal_x, terminal_y), (terminal_x + terminal_width, terminal_y + terminal_height)],
-            fill=0
+            fill=ink
         )
 
         if percentage > 0:
@@ -343,7 +666,7 @@ class KlipperScreen:
             draw.rectangle(
                 [(battery_x + 2, battery_y + 2),
                  (battery_x + 2 + fill_width, battery_y + battery_height - 2)],
-                fill=0
+                fill=ink
             )
 
         if is_charging:
@@ -357,39 +680,84 @@ class KlipperScreen:
                 (bolt_center_x + 2, bolt_center_y + 1),
                 (bolt_center_x - 3, bolt_center_y + 1),
             ]
-            draw.polygon(bolt_points, fill=1, outline=0)
+            draw.polygon(bolt_points, fill=paper, outline=ink)
 
-        percentage_text = f"{percentage}%"
-        font = ImageFont.load_default()
-        try:
-            bbox = draw.textbbox((0, 0), percentage_text, font=font)
-            text_width = bbox[2] - bbox[0]
-        except:
-            text_width = len(percentage_text) * 8
+        text_x = battery_x - pct_width - 5
+        draw.text((text_x, y), percentage_text, font=font, fill=ink)
 
-        text_x = battery_x - text_width - 5
-        draw.text((text_x, y), percentage_text, font=font, fill=0)
+        left, top, right, bottom = sprite.getbbox()
+        return sprite.crop((left, top, right, bottom)), left - x, top - y
 
-    def render(self) -> Image.Image:
-        """Render the Klipper screen"""
+    def _build_base_image(self):
+        """Pre-render the static title and instruction bar"""
         image = Image.new('1', (self.width, self.height), 1)  # 1-bit, white background
         draw = ImageDraw.Draw(image)
 
         # Draw title
         title = "Klipper Printers"
-        title_bbox = draw.textbbox((0, 0), title, font=self.title_font)
-        title_width = title_bbox[2] - title_bbox[0]
+        title_width = text_width(self.title_font, title, '1')
         draw.text(((self.width - title_width) // 2, 10), title, font=self.title_font, fill=0)
 
-        # Draw battery status
+        # Draw instructions
+        instruction = "NEXT: Navigate | HOLD: Scan | Auto-refresh: 3min"
+        try:
+            instr_width = text_width(self.small_font, instruction, '1')
+        except:
+            instr_width = len(instruction) * 7
+
+        instr_x = (self.width - instr_width) // 2
+        draw.text((instr_x, self.height - 25), instruction, font=self.small_font, fill=0)
+
+        self._base_image = image
+        self._base_key = (self.width, self.height)
+
+    def _status_footer(self) -> Optional[str]:
+        """'Refreshing...' / 'Updated Nm ago' line, if one should be shown"""
+        if self.refreshing:
+            return "Refreshing..."
+        if self.last_status_refresh > 0 and len(self._table) > 0:
+            ago_secs = int(time.time() - self.last_status_refresh)
+            if ago_secs < 60:
+                ago_str = f"{ago_secs}s ago"
+            else:
+                ago_str = f"{ago_secs // 60}m ago"
+            return f"Updated {ago_str}"
+        return None
+
+    def render(self) -> Image.Image:
+        """
+        Render the Klipper screen
+
+        Returns:
+            PIL Image of the screen (a new image per frame - later renders
+            never draw into it, so it is safe to hand to another thread)
+        """
+        battery = None
         if self.battery_monitor:
             try:
-                battery_pct = self.battery_monitor.get_percentage()
-                charging = self.battery_monitor.is_charging()
-                self._draw_battery_icon(draw, self.width - 10, 10, battery_pct, charging)
+                battery = (self.battery_monitor.get_percentage(), self.battery_monitor.is_charging())
             except Exception as e:
                 self.logger.warning(f"Failed to get battery status: {e}")
 
+        footer = self._status_footer()
+
+        # Nothing visible changed since the last frame - reuse it
+        table = self._table
+        state = (self.scanning, self.scan_progress, self.current_index, battery, footer,
+                 self._table_version, self.width, self.height)
+        if self._last_image is not None and state == self._last_state:
+            return self._last_image
+
+        # Start from a copy of the static chrome (rebuilt on resize)
+        if self._base_key != (self.width, self.height):
+            self._build_base_image()
+        image = self._base_image.copy()
+        draw = ImageDraw.Draw(image)
+
+        # Draw battery status
+        if battery is not None:
+            self._draw_battery_icon(draw, self.width - 10, 10, battery[0], battery[1])
+
         y_offset = 50
 
         # Scanning state with progress bar
@@ -417,36 +785,33 @@ class KlipperScreen:
                 )
 
             # Show found count
-            found_text = f"Found {len(self.printers)} printer(s) so far..."
+            found_text = f"Found {len(table)} printer(s) so far..."
             draw.text((10, bar_y + 35), found_text, font=self.small_font, fill=0)
 
-        elif len(self.printers) == 0:
+        elif len(table) == 0:
             # No printers found
             message = "No Klipper printers found."
-            msg_bbox = draw.textbbox((0, 0), message, font=self.font)
-            msg_width = msg_bbox[2] - msg_bbox[0]
+            msg_width = text_width(self.font, message, '1')
             draw.text(((self.width - msg_width) // 2, self.height // 2 - 20), message, font=self.font, fill=0)
 
             hint = "Press button to scan network."
-            hint_bbox = draw.textbbox((0, 0), hint, font=self.small_font)
-            hint_width = hint_bbox[2] - hint_bbox[0]
+            hint_width = text_width(self.small_font, hint, '1')
             draw.text(((self.width - hint_width) // 2, self.height // 2 + 10), hint, font=self.small_font, fill=0)
 
         else:
             # Display printers
-            found_text = f"Found {len(self.printers)} printer(s):"
+            found_text = f"Found {len(table)} printer(s):"
             draw.text((10, y_offset), found_text, font=self.font, fill=0)
             y_offset += 35
 
             # Calculate pagination
             current_page = self.current_index // self.items_per_page
             start_idx = current_page * self.items_per_page
-            end_idx = min(start_idx + self.items_per_page, len(self.printers))
+            end_idx = min(start_idx + self.items_per_page, len(table))
 
             # Draw printer cards
             card_height = 150
             for i in range(start_idx, end_idx):
-                printer = self.printers[i]
                 is_selected = (i == self.current_index)
 
                 # Draw selection indicator
@@ -458,29 +823,33 @@ class KlipperScreen:
                     )
 
                 # Printer name/hostname
-                name = printer['hostname'] or printer['ip']
+                ip = table.ips[i]
+                name = table.hostnames[i] or ip
                 draw.text((15, y_offset), name, font=self.large_font, fill=0)
 
                 # State badge
-                state = printer['state']
+                state = table.states[i]
                 state_x = self.width - 100
                 draw.text((state_x, y_offset), f"[{state}]", font=self.small_font, fill=0)
 
                 # IP address
-                draw.text((15, y_offset + 25), f"IP: {printer['ip']}", font=self.small_font, fill=0)
+                draw.text((15, y_offset + 25), f"IP: {ip}", font=self.small_font, fill=0)
 
-                # Temperatures
-                if printer['extruder_temp'] is not None:
-                    temp_text = f"Extruder: {printer['extruder_temp']:.1f}C / {printer['extruder_target']:.1f}C"
+                # Temperatures (NaN = not reported)
+                extruder_temp = table.extruder_temps[i]
+                if not math.isnan(extruder_temp):
+                    temp_text = f"Extruder: {extruder_temp:.1f}C / {table.extruder_targets[i]:.1f}C"
                     draw.text((15, y_offset + 45), temp_text, font=self.small_font, fill=0)
 
-                if printer['bed_temp'] is not None:
-                    bed_text = f"Bed: {printer['bed_temp']:.1f}C / {printer['bed_target']:.1f}C"
+                bed_temp = table.bed_temps[i]
+                if not math.isnan(bed_temp):
+                    bed_text = f"Bed: {bed_temp:.1f}C / {table.bed_targets[i]:.1f}C"
                     draw.text((15, y_offset + 65), bed_text, font=self.small_font, fill=0)
 
                 # Print progress if printing
-                if state == 'printing' and printer['progress'] is not None:
-                    progress_pct = printer['progress'] * 100
+                progress = table.progress[i]
+                if state == 'printing' and not math.isnan(progress):
+                    progress_pct = progress * 100
                     progress_text = f"Progress: {progress_pct:.0f}%"
                     draw.text((15, y_offset + 85), progress_text, font=self.small_font, fill=0)
 
@@ -493,16 +862,16 @@ class KlipperScreen:
                         outline=0,
                         width=1
                     )
-                    fill_w = int(prog_bar_width * printer['progress'])
+                    fill_w = int(prog_bar_width * progress)
                     if fill_w > 0:
                         draw.rectangle(
                             [(prog_bar_x + 1, y_offset + 88), (prog_bar_x + fill_w - 1, y_offset + 87 + prog_bar_height - 1)],
                             fill=0
                         )
 
-                    if printer.get('filename'):
+                    if table.filenames[i]:
                         # Strip path, trim to available width
-                        fname = printer['filename'].split('/')[-1]
+                        fname = table.filenames[i].split('/')[-1]
                         # Truncate to avoid overflow
                         max_chars = 45
                         display_fname = fname if len(fname) <= max_chars else fname[:max_chars - 2] + '..'
@@ -512,47 +881,20 @@ class KlipperScreen:
                 y_offset += card_height + 10
 
             # Page indicator
-            total_pages = (len(self.printers) + self.items_per_page - 1) // self.items_per_page
+            total_pages = (len(table) + self.items_per_page - 1) // self.items_per_page
             if total_pages > 1:
                 page_text = f"Page {current_page + 1}/{total_pages}"
-                page_bbox = draw.textbbox((0, 0), page_text, font=self.small_font)
-                page_width = page_bbox[2] - page_bbox[0]
+                page_width = text_width(self.small_font, page_text, '1')
                 draw.text(((self.width - page_width) // 2, self.height - 50), page_text, font=self.small_font, fill=0)
 
-        # Draw 'Refreshing...' indicator during auto-refresh
-        if self.refreshing:
-            ref_text = "Refreshing..."
+        # Draw 'Refreshing...' / 'Updated ...' status line
+        if footer:
             try:
-                ref_bbox = draw.textbbox((0, 0), ref_text, font=self.small_font)
-                ref_w = ref_bbox[2] - ref_bbox[0]
+                footer_w = text_width(self.small_font, footer, '1')
             except Exception:
-                ref_w = len(ref_text) * 7
-            draw.text(((self.width - ref_w) // 2, self.height - 45), ref_text, font=self.small_font, fill=0)
-        elif self.last_status_refresh > 0 and len(self.printers) > 0:
-            import time as _time
-            from datetime import datetime
-            ago_secs = int(_time.time() - self.last_status_refresh)
-            if ago_secs < 60:
-                ago_str = f"{ago_secs}s ago"
-            else:
-                ago_str = f"{ago_secs // 60}m ago"
-            upd_text = f"Updated {ago_str}"
-            try:
-                upd_bbox = draw.textbbox((0, 0), upd_text, font=self.small_font)
-                upd_w = upd_bbox[2] - upd_bbox[0]
-            except Exception:
-                upd_w = len(upd_text) * 7
-            draw.text(((self.width - upd_w) // 2, self.height - 45), upd_text, font=self.small_font, fill=0)
-
-        # Draw instructions
-        instruction = "NEXT: Navigate | HOLD: Scan | Auto-refresh: 3min"
-        try:
-            instr_bbox = draw.textbbox((0, 0), instruction, font=self.small_font)
-            instr_width = instr_bbox[2] - instr_bbox[0]
-        except:
-            instr_width = len(instruction) * 7
-
-        instr_x = (self.width - instr_width) // 2
-        draw.text((instr_x, self.height - 25), instruction, font=self.small_font, fill=0)
+                footer_w = len(footer) * 7
+            draw.text(((self.width - footer_w) // 2, self.height - 45), footer, font=self.small_font, fill=0)
 
+        self._last_image = image
+        self._last_state = state
         return image
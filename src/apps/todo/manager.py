@@ -6,13 +6,85 @@ Handles data persistence and screen refresh for the To-Do app.
 
 import json
 import logging
+import os
+import shutil
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
+
+# Optional: faster JSON encoding (requires orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_todos(todos: Dict[str, List[Dict[str, Any]]]) -> bytes:
+    """
+    Serialize todos to UTF-8 JSON for todos.json
+
+    orjson indents at C speed. The stdlib fallback stays compact, because
+    json.dumps(indent=...) bypasses the C encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(todos, option=orjson.OPT_INDENT_2)
+    return json.dumps(todos, separators=(',', ':')).encode('utf-8')
+
+
+def write_todos(path: Union[str, Path], todos: Dict[str, List[Dict[str, Any]]]):
+    """
+    Write todos to path atomically
+
+    The JSON goes to a temp file next to path that is then swapped in, so a
+    crash mid-write or a concurrent reader never sees a truncated list. The
+    file keeps its mode. Raises OSError if the write fails.
+    """
+    data = encode_todos(todos)
+    todos_dir = Path(path).resolve().parent
+    with tempfile.NamedTemporaryFile('wb', dir=todos_dir, suffix='.tmp', delete=False) as tmp:
+        try:
+            tmp.write(data)
+        except Exception:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    try:
+        # NamedTemporaryFile creates the file 0600 - keep todos.json's
+        # own mode, or what a plain open() would give a new file
+        try:
+            shutil.copymode(path, tmp.name)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp.name, 0o666 & ~umask)
+        os.replace(tmp.name, path)
+    except Exception:
+        os.unlink(tmp.name)
+        raise
+
+
+def _copy_todos(todos: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Copy todos deep enough that changing the copy can't touch the original (tasks are flat dicts)"""
+    return {**todos, 'tasks': [dict(task) for task in todos.get('tasks', [])]}
+
+
+def _file_key(st: os.stat_result) -> Tuple[int, int, int]:
+    """
+    Identity of one version of todos.json
+
+    An in-place rewrite within one mtime tick still changes the size, and an
+    atomic swap changes the inode.
+    """
+    return st.st_mtime_ns, st.st_size, st.st_ino
 
 
 class TodoManager:
     """Manages To-Do list data and persistence"""
-    
+
+    # Screen refreshes requested within this window are coalesced into one
+    REFRESH_DEBOUNCE = 0.5  # seconds
+
     def __init__(self, app_instance=None, todos_file: str = "todos.json"):
         """
         Initialize TodoManager
@@ -24,32 +96,72 @@ class TodoManager:
         self.app_instance = app_instance
         self.todos_file = Path(todos_file)
         self.logger = logging.getLogger(__name__)
+
+        # Last loaded/saved todos, valid while the file's mtime, size and inode
+        # are unchanged (the e-ink screen writes the same file, so edits there
+        # invalidate it - even two writes within one mtime tick)
+        self._lock = threading.Lock()
+        self._cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._file_key: Optional[Tuple[int, int, int]] = None
+        self._id_index: Dict[str, int] = {}  # task id -> position in the cached tasks
+
+        # Pending debounced screen refresh
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
     
     def load_todos(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Load todos from JSON file
-        
+
+        The file is only re-read when its mtime, size or inode has changed
+        since the last load or save; otherwise a copy of the cached todos is returned, so
+        callers may change it freely before passing it to save_todos().
+
         Returns:
             Dictionary with 'tasks' key containing list of todo items
         """
+        with self._lock:
+            return _copy_todos(self._load_locked())
+
+    def _load_locked(self) -> Dict[str, List[Dict[str, Any]]]:
+        """load_todos() body, returning the cache itself; caller holds self._lock"""
         try:
-            if self.todos_file.exists():
-                with open(self.todos_file, 'r') as f:
-                    data = json.load(f)
-                    # Ensure data has correct structure
-                    if isinstance(data, dict) and 'tasks' in data:
-                        return data
-                    # Legacy format: list of tasks
-                    elif isinstance(data, list):
-                        return {'tasks': data}
-                    else:
-                        self.logger.warning(f"Invalid todos format, returning empty list")
-                        return {'tasks': []}
+            try:
+                file_key = _file_key(self.todos_file.stat())
+            except FileNotFoundError:
+                self._set_cache({'tasks': []}, None)
+                return self._cache
+
+            if self._cache is not None and file_key == self._file_key:
+                return self._cache
+
+            with open(self.todos_file, 'r') as f:
+                data = json.load(f)
+            # Ensure data has correct structure
+            if isinstance(data, dict) and 'tasks' in data:
+                todos = data
+            # Legacy format: list of tasks
+            elif isinstance(data, list):
+                todos = {'tasks': data}
             else:
-                return {'tasks': []}
+                self.logger.warning(f"Invalid todos format, returning empty list")
+                todos = {'tasks': []}
+
+            self._set_cache(todos, file_key)
+            return todos
         except Exception as e:
             self.logger.error(f"Failed to load todos: {e}")
-            return {'tasks': []}
+            # Drop the previous load too, or the id index would point into it
+            self._set_cache({'tasks': []}, None)
+            return self._cache
+
+    def _set_cache(self, todos: Dict[str, List[Dict[str, Any]]], file_key: Optional[Tuple[int, int, int]]):
+        """Remember todos as the file's current contents and re-index task ids"""
+        self._cache = todos
+        self._file_key = file_key
+        self._id_index = {}
+        for i, task in enumerate(todos.get('tasks', [])):
+            self._id_index.setdefault(task.get('id'), i)
     
     def save_todos(self, todos: Dict[str, List[Dict[str, Any]]]) -> bool:
         """
@@ -61,26 +173,127 @@ class TodoManager:
         Returns:
             True if successful, False otherwise
         """
+        with self._lock:
+            return self._save_locked(todos)
+
+    def _save_locked(self, todos: Dict[str, List[Dict[str, Any]]]) -> bool:
+        """save_todos() body; caller holds self._lock"""
         try:
-            with open(self.todos_file, 'w') as f:
-                json.dump(todos, f, indent=2)
+            write_todos(self.todos_file, todos)
+
+            # Cache a copy - the caller still owns todos and may keep changing it
+            self._set_cache(_copy_todos(todos), _file_key(self.todos_file.stat()))
             self.logger.debug(f"Saved {len(todos.get('tasks', []))} todos")
             return True
         except Exception as e:
             self.logger.error(f"Failed to save todos: {e}")
+            # The cached todos may hold the unsaved changes - re-read next time
+            self._cache = None
             return False
     
-    def refresh_screen(self) -> bool:
+    def get_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
-        Trigger a refresh of the To-Do screen on the e-ink display
-        
+        Look up a task by id
+
+        Use update_by_id() to change a task; the one returned here is a copy.
+
+        Returns:
+            A copy of the task, or None if no task has that id
+        """
+        with self._lock:
+            todos = self._load_locked()
+            index = self._id_index.get(task_id)
+            return dict(todos['tasks'][index]) if index is not None else None
+
+    def add_task(self, task: Dict[str, Any]) -> bool:
+        """
+        Append a task and save the list
+
+        Loading, appending and saving happen under the manager lock, so two
+        tasks added at once are both kept.
+
         Returns:
             True if successful, False otherwise
         """
+        with self._lock:
+            todos = self._load_locked()
+            todos['tasks'].append(dict(task))
+            return self._save_locked(todos)
+
+    def update_by_id(self, task_id: str, update: Callable[[Dict[str, Any]], None]) -> Optional[Dict[str, Any]]:
+        """
+        Change a task by id and save the list
+
+        The lookup, update(task) and the save all happen under the manager
+        lock, so a concurrent edit can't land in between and be overwritten.
+
+        Args:
+            task_id: Id of the task to change
+            update: Called with the task dict; modifies it in place
+
+        Returns:
+            A copy of the updated task, or None if no task has that id
+        """
+        with self._lock:
+            todos = self._load_locked()
+            index = self._id_index.get(task_id)
+            if index is None:
+                return None
+            task = todos['tasks'][index]
+            update(task)
+            self._save_locked(todos)
+            return dict(task)
+
+    def remove_by_id(self, task_id: str) -> bool:
+        """
+        Delete a task by id and save the list
+
+        Returns:
+            True if the task existed, False otherwise
+        """
+        with self._lock:
+            todos = self._load_locked()
+            index = self._id_index.get(task_id)
+            if index is None:
+                return False
+            del todos['tasks'][index]
+            self._save_locked(todos)
+            return True
+
+    def refresh_screen(self) -> bool:
+        """
+        Schedule a refresh of the To-Do screen on the e-ink display
+
+        The redraw runs REFRESH_DEBOUNCE seconds after the last call, so a
+        burst of edits costs a single e-ink update.
+
+        Returns:
+            True if a refresh was scheduled, False otherwise
+        """
         if not self.app_instance:
             self.logger.warning("No app instance available for screen refresh")
             return False
-        
+
+        with self._refresh_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            self._refresh_timer = threading.Timer(self.REFRESH_DEBOUNCE, self._refresh_now)
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+        return True
+
+    def _refresh_now(self) -> bool:
+        """
+        Redraw the To-Do screen if it is showing
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._refresh_lock:
+            # A newer call may already have scheduled the next refresh
+            if self._refresh_timer is threading.current_thread():
+                self._refresh_timer = None
+
         try:
             from src.ui.navigation import Screen
             
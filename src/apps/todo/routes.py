@@ -50,8 +50,6 @@ def add_todo():
         if not task_text:
             return jsonify({'error': 'Task text is required'}), 400
         
-        todos = todo_manager.load_todos()
-        
         # Generate new task
         new_task = {
             'id': str(uuid.uuid4()),
@@ -60,8 +58,7 @@ def add_todo():
             'created_at': datetime.datetime.now().isoformat()
         }
         
-        todos['tasks'].append(new_task)
-        todo_manager.save_todos(todos)
+        todo_manager.add_task(new_task)
         todo_manager.refresh_screen()
         
         logger.info(f"Added todo: {task_text}")
@@ -76,17 +73,16 @@ def add_todo():
 def toggle_todo(task_id):
     """Toggle task completion status"""
     try:
-        todos = todo_manager.load_todos()
-        
-        for task in todos['tasks']:
-            if task['id'] == task_id:
-                task['completed'] = not task['completed']
-                todo_manager.save_todos(todos)
-                todo_manager.refresh_screen()
-                logger.info(f"Toggled todo {task_id}: {task['completed']}")
-                return jsonify({'success': True, 'task': task})
-        
-        return jsonify({'error': 'Task not found'}), 404
+        def toggle(task):
+            task['completed'] = not task['completed']
+
+        task = todo_manager.update_by_id(task_id, toggle)
+        if task is None:
+            return jsonify({'error': 'Task not found'}), 404
+
+        todo_manager.refresh_screen()
+        logger.info(f"Toggled todo {task_id}: {task['completed']}")
+        return jsonify({'success': True, 'task': task})
         
     except Exception as e:
         logger.error(f"Failed to toggle todo: {e}")
@@ -103,17 +99,13 @@ def edit_todo(task_id):
         if not new_text:
             return jsonify({'error': 'Task text is required'}), 400
         
-        todos = todo_manager.load_todos()
-        
-        for task in todos['tasks']:
-            if task['id'] == task_id:
-                task['text'] = new_text
-                todo_manager.save_todos(todos)
-                todo_manager.refresh_screen()
-                logger.info(f"Edited todo {task_id}: {new_text}")
-                return jsonify({'success': True, 'task': task})
-        
-        return jsonify({'error': 'Task not found'}), 404
+        task = todo_manager.update_by_id(task_id, lambda task: task.update(text=new_text))
+        if task is None:
+            return jsonify({'error': 'Task not found'}), 404
+
+        todo_manager.refresh_screen()
+        logger.info(f"Edited todo {task_id}: {new_text}")
+        return jsonify({'success': True, 'task': task})
         
     except Exception as e:
         logger.error(f"Failed to edit todo: {e}")
@@ -124,13 +116,7 @@ def edit_todo(task_id):
 def delete_todo(task_id):
     """Delete a to-do task"""
     try:
-        todos = todo_manager.load_todos()
-        initial_count = len(todos['tasks'])
-        
-        todos['tasks'] = [t for t in todos['tasks'] if t['id'] != task_id]
-        
-        if len(todos['tasks']) < initial_count:
-            todo_manager.save_todos(todos)
+        if todo_manager.remove_by_id(task_id):
             todo_manager.refresh_screen()
             logger.info(f"Deleted todo {task_id}")
             return jsonify({'success': True})
@@ -4,9 +4,14 @@ To-Do List Screen
 E-ink display screen for managing to-do tasks.
 """
 
+import json
 import logging
-from typing import List, Dict, Any
-from PIL import Image, ImageDraw, ImageFont
+import os
+from typing import List, Dict, Any, Optional, Tuple
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from src.utils.fonts import text_width
+from .manager import write_todos
 
 
 class ToDoScreen:
@@ -14,6 +19,10 @@ class ToDoScreen:
     To Do list screen for managing tasks
     """
 
+    CHECKBOX_SIZE = 24  # Increased from 16 for better visibility
+    LINE_HEIGHT = 40  # Minimum row height, increased from 24 for larger font
+    LINE_SPACING = 36  # Spacing between wrapped lines of one task
+
     def __init__(self, width: int = 800, height: int = 480, font_size: int = 18, battery_monitor=None):
         """
         Initialize To Do screen
@@ -40,6 +49,10 @@ class ToDoScreen:
             self.title_font = ImageFont.load_default()
             self.item_font = ImageFont.load_default()
 
+        # Height of a capital in item_font, for centring checkboxes on the first line
+        a_bbox = self.item_font.getbbox("A")
+        self._item_text_height = a_bbox[3] - a_bbox[1]
+
         # To do items: list of dicts with 'text' and 'completed' keys
         self.todos: List[Dict[str, Any]] = []
         self.current_index = 0  # Currently selected item
@@ -48,19 +61,51 @@ class ToDoScreen:
 
         # Load todos from file (same location as web server)
         self.todos_file = "todos.json"
+        os.makedirs(os.path.dirname(self.todos_file) or '.', exist_ok=True)  # Once, not per save
+
+        # Pre-rasterized checkboxes (by completed state) and battery icons
+        self._checkbox_masks = {checked: self._render_checkbox(checked) for checked in (False, True)}
+        self._highlight_fill = ImageColor.getcolor('lightgray', 'L')
+        self._battery_cache: Dict[Tuple[int, bool], Tuple[Image.Image, int, int]] = {}
+
+        # Static title and separator, rebuilt if the screen size changes
+        self._base_key = None
+        self._base_image: Optional[Image.Image] = None
+
+        # (text, max_width, max_lines) -> wrapped lines; tasks rarely change
+        # between frames, so each is only measured when first shown
+        self._wrap_cache: Dict[Tuple[str, int, int], List[Tuple[str, int, int]]] = {}
+        # Rows of the current page, kept until the todos, page or width change
+        self._layout = []
+        self._layout_key = None
+        self._page_cache = None  # ((count, page, per page, width), text, x)
+        self._todos_mtime = 0  # st_mtime_ns of the last load/save, None if the file was missing
+        self._todos_version = 0  # Bumped whenever self.todos is reloaded or saved
+
+        # Last frame and what it showed, so a selection move only redraws two rows
+        self._last_image: Optional[Image.Image] = None
+        self._last_rendered = None
+        self._last_index = None
         self._load_todos()
 
     def _load_todos(self):
-        """Load todos from JSON file"""
-        import os
-        import json
-
-        if os.path.exists(self.todos_file):
+        """Load todos from JSON file, unless it is unchanged since the last load"""
+        try:
+            mtime = os.stat(self.todos_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime == self._todos_mtime:
+            return
+        self._todos_mtime = mtime
+        self._todos_version += 1
+
+        if mtime is not None:
             try:
-                with open(self.todos_file, 'r') as f:
-                    data = json.load(f)
-                    # Extract tasks array from JSON structure
-                    self.todos = data.get('tasks', [])
+                # One read of the raw bytes; json.loads decodes UTF-8 itself
+                with open(self.todos_file, 'rb') as f:
+                    data = json.loads(f.read())
+                # Extract tasks array from JSON structure
+                self.todos = data.get('tasks', [])
                 self.logger.info(f"Loaded {len(self.todos)} todos from {self.todos_file}")
             except Exception as e:
                 self.logger.error(f"Failed to load todos: {e}")
@@ -71,15 +116,12 @@ class ToDoScreen:
 
     def _save_todos(self):
         """Save todos to JSON file"""
-        import os
-        import json
-
-        # Ensure data directory exists
-        os.makedirs(os.path.dirname(self.todos_file) if os.path.dirname(self.todos_file) else '.', exist_ok=True)
-
         try:
-            with open(self.todos_file, 'w') as f:
-                json.dump({'tasks': self.todos}, f, indent=2)
+            # Same atomic write as the web side, so neither ever reads a
+            # half-written file
+            write_todos(self.todos_file, {'tasks': self.todos})
+            self._todos_mtime = os.stat(self.todos_file).st_mtime_ns
+            self._todos_version += 1
             self.logger.info(f"Saved {len(self.todos)} todos to {self.todos_file}")
         except Exception as e:
             self.logger.error(f"Failed to save todos: {e}")
@@ -88,6 +130,9 @@ class ToDoScreen:
         """
         Draw battery icon with percentage and charging indicator
 
+        The icon is rasterized once per (percentage, charging) pair and then
+        stamped from the cache.
+
         Args:
             draw: ImageDraw object
             x: X position (top-right corner)
@@ -95,19 +140,47 @@ class ToDoScreen:
             percentage: Battery percentage (0-100)
             is_charging: Whether battery is currently charging
         """
-        self.logger.debug(f"Drawing battery icon: {percentage}% charging={is_charging}")
-        
+        key = (percentage, is_charging)
+        cached = self._battery_cache.get(key)
+        if cached is None:
+            self.logger.debug(f"Rendering battery icon: {percentage}% charging={is_charging}")
+            cached = self._battery_cache[key] = self._render_battery_sprite(percentage, is_charging)
+        sprite, dx, dy = cached
+        draw.bitmap((x + dx, y + dy), sprite, fill='black')
+
+    def _render_battery_sprite(self, percentage: int, is_charging: bool) -> Tuple[Image.Image, int, int]:
+        """
+        Rasterize the battery icon into a coverage mask (255 = ink)
+
+        Returns the mask cropped to its ink and its offset from the (x, y)
+        that _draw_battery_icon is called with.
+        """
+        percentage_text = f"{percentage}%"
+        font = ImageFont.load_default()
+        try:
+            pct_width = text_width(font, percentage_text)
+        except:
+            pct_width = len(percentage_text) * 8
+
         # Battery dimensions
         battery_width = 30
         battery_height = 14
         terminal_width = 2
         terminal_height = 6
 
+        # Draw with inverted colours on a scratch canvas anchored at (x, y)
+        margin = 10
+        x = pct_width + battery_width + 2 * margin
+        y = margin
+        sprite = Image.new('L', (x + margin, battery_height + 3 * margin), 0)
+        draw = ImageDraw.Draw(sprite)
+        ink, paper = 255, 0
+
         # Draw battery outline
         battery_x = x - battery_width
         draw.rectangle(
             [(battery_x, y), (battery_x + battery_width, y + battery_height)],
-            outline='black',
+            outline=ink,
             width=1
         )
 
@@ -116,7 +189,7 @@ class ToDoScreen:
         terminal_y = y + (battery_height - terminal_height) // 2
         draw.rectangle(
             [(terminal_x, terminal_y), (terminal_x + terminal_width, terminal_y + terminal_height)],
-            fill='black'
+            fill=ink
         )
 
         # Draw battery fill based on percentage
@@ -124,7 +197,7 @@ class ToDoScreen:
         if fill_width > 0:
             draw.rectangle(
                 [(battery_x + 2, y + 2), (battery_x + 2 + fill_width, y + battery_height - 2)],
-                fill='black'
+                fill=ink
             )
 
         # Draw charging indicator (lightning bolt) if charging
@@ -140,20 +213,110 @@ class ToDoScreen:
                 (bolt_center_x + 2, bolt_center_y + 1),    # Lower right
                 (bolt_center_x - 3, bolt_center_y + 1),    # Lower left
             ]
-            # Draw white bolt with black outline for visibility
-            draw.polygon(bolt_points, fill='white', outline='black')
+            # White bolt with black outline for visibility (carved out of the fill)
+            draw.polygon(bolt_points, fill=paper, outline=ink)
 
         # Draw percentage text
-        percentage_text = f"{percentage}%"
-        font = ImageFont.load_default()
-        try:
-            bbox = draw.textbbox((0, 0), percentage_text, font=font)
-            text_width = bbox[2] - bbox[0]
-        except:
-            text_width = len(percentage_text) * 8
+        text_x = battery_x - pct_width - 5
+        draw.text((text_x, y), percentage_text, font=font, fill=ink)
+
+        left, top, right, bottom = sprite.getbbox()
+        return sprite.crop((left, top, right, bottom)), left - x, top - y
+
+    def _render_checkbox(self, checked: bool) -> Image.Image:
+        """Rasterize a CHECKBOX_SIZE checkbox, crossed if checked, into a coverage mask"""
+        size = self.CHECKBOX_SIZE
+        mask = Image.new('L', (size + 1, size + 1), 0)
+        draw = ImageDraw.Draw(mask)
+        draw.rectangle([(0, 0), (size, size)], outline=255, width=2)
+
+        # Draw X if completed
+        if checked:
+            draw.line([(4, 4), (size - 4, size - 4)], fill=255, width=3)
+            draw.line([(size - 4, 4), (4, size - 4)], fill=255, width=3)
+        return mask
+
+    def _wrap_text(self, text: str, max_width: int, max_lines: int) -> List[Tuple[str, int, int]]:
+        """
+        Word-wrap text in item_font to max_width, at most max_lines lines
 
-        text_x = battery_x - text_width - 5
-        draw.text((text_x, y), percentage_text, font=font, fill='black')
+        Returns (line, right, height) per line: the right edge and height of
+        the line's ink relative to where it is drawn, for the strikethrough.
+        """
+        key = (text, max_width, max_lines)
+        cached = self._wrap_cache.get(key)
+        if cached is not None:
+            return cached
+
+        font = self.item_font
+        words = text.split()
+        lines = []
+        current_line = ''  # Built up word by word, so no re-joining per word
+
+        # Most tasks fit on one line - one measurement, no word-by-word probing
+        if text_width(font, ' '.join(words)) <= max_width:
+            current_line, words = ' '.join(words), []
+
+        for word in words:
+            # Test if adding this word would exceed max width
+            test_line = f"{current_line} {word}" if current_line else word
+
+            if text_width(font, test_line) <= max_width:
+                current_line = test_line
+            else:
+                # Save current line if it has content
+                if current_line:
+                    lines.append(current_line)
+                    current_line = ''
+
+                # Check if single word is too long
+                if text_width(font, word) > max_width:
+                    # Truncate long word to fit
+                    truncated = self._truncate_to_width(word, max_width)
+                    if truncated:
+                        lines.append(truncated)
+                    current_line = ''
+                else:
+                    current_line = word
+
+                # Stop if we've reached max lines
+                if len(lines) >= max_lines:
+                    break
+
+        # Add remaining words if we haven't hit max lines
+        if current_line and len(lines) < max_lines:
+            lines.append(current_line)
+
+        # Limit to max_lines and add ellipsis if truncated
+        if len(lines) > max_lines:
+            lines = lines[:max_lines]
+            lines[-1] = lines[-1] + "..."
+
+        wrapped = []
+        for line in lines:
+            _, top, right, bottom = font.getbbox(line)
+            wrapped.append((line, right, bottom - top))
+
+        if len(self._wrap_cache) >= 256:
+            self._wrap_cache.clear()
+        self._wrap_cache[key] = wrapped
+        return wrapped
+
+    def _truncate_to_width(self, word: str, max_width: int) -> str:
+        """
+        Longest prefix of word that fits in max_width with "..." appended
+
+        Binary search on the prefix length, so an N-character word costs
+        O(log N) measurements. Returns '' if not even one character fits.
+        """
+        low, high = 0, len(word) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if text_width(self.item_font, word[:mid] + "...") <= max_width:
+                low = mid
+            else:
+                high = mid - 1
+        return word[:low] + "..." if low > 0 else ''
 
     def add_todo(self, text: str):
         """Add a new todo item"""
@@ -199,190 +362,188 @@ class ToDoScreen:
             if self.current_index >= (self.current_page + 1) * self.items_per_page:
                 self.current_page += 1
 
-    def render(self) -> Image.Image:
-        """
-        Render the To Do screen
-
-        Returns:
-            PIL Image of the screen
-        """
-        # Reload todos to get latest from web interface
-        self._load_todos()
-        
-        # Create image
+    def _build_base_image(self):
+        """Pre-render the static title and separator, and the help text mask"""
         image = Image.new('L', (self.width, self.height), 255)
         draw = ImageDraw.Draw(image)
 
         # Draw title
         title = "To-Do List"
-        title_bbox = draw.textbbox((0, 0), title, font=self.title_font)
-        title_width = title_bbox[2] - title_bbox[0]
+        title_width = text_width(self.title_font, title)
         title_x = (self.width - title_width) // 2
-        y_offset = 10
-        draw.text((title_x, y_offset), title, fill='black', font=self.title_font)
-        y_offset += 40
-
-        # Draw battery status if available (top right corner)
-        if self.battery_monitor:
-            try:
-                battery_pct = self.battery_monitor.get_percentage()
-                charging = self.battery_monitor.is_charging()
-                # Use drawn battery icon instead of emoji (emojis show as boxes on e-ink)
-                self._draw_battery_icon(draw, self.width - 10, 10, battery_pct, charging)
-            except Exception as e:
-                self.logger.warning(f"Failed to get battery status: {e}")
+        draw.text((title_x, 10), title, fill='black', font=self.title_font)
 
         # Draw separator line
-        draw.line([(10, y_offset), (self.width - 10, y_offset)], fill='black', width=2)
-        y_offset += 10
+        draw.line([(10, 50), (self.width - 10, 50)], fill='black', width=2)
+
+        self._base_image = image
+        self._base_key = (self.width, self.height)
+
+        # Help text at bottom (matching MainMenuScreen format), as a glyph
+        # coverage mask to stamp over whatever the list drew there
+        help_text = "Hold: Main Menu"
+        try:
+            help_width = text_width(self.font, help_text)
+        except:
+            help_width = len(help_text) * 8
+
+        _, _, right, bottom = self.font.getbbox(help_text)
+        self._help_mask = Image.new('L', (right, bottom), 0)
+        ImageDraw.Draw(self._help_mask).text((0, 0), help_text, font=self.font, fill=255)
+        self._help_pos = ((self.width - help_width) // 2, self.height - 40)
+
+    def _layout_rows(self) -> List[Tuple[int, int, List[Tuple[str, int, int]]]]:
+        """Work out (index, y, wrapped lines) for each todo on the current page"""
+        key = (self._todos_version, self.current_page, self.items_per_page, self.width)
+        if key == self._layout_key:
+            return self._layout
+        rows = []
+        y_offset = 60
+        start_idx = self.current_page * self.items_per_page
+        end_idx = min(start_idx + self.items_per_page, len(self.todos))
+        max_width = self.width - (20 + self.CHECKBOX_SIZE + 10) - 20
+        for i in range(start_idx, end_idx):
+            lines = self._wrap_text(self.todos[i]['text'], max_width, 3)
+            rows.append((i, y_offset, lines))
+            y_offset += max(self.LINE_HEIGHT, len(lines) * self.LINE_SPACING)
+        self._layout, self._layout_key = rows, key
+        return rows
+
+    def _page_indicator(self) -> Tuple[Optional[str], int]:
+        """Page indicator text (None for a single page) and its centred x"""
+        key = (len(self.todos), self.current_page, self.items_per_page, self.width)
+        if self._page_cache is None or self._page_cache[0] != key:
+            page_info, page_x = None, 0
+            total_pages = (len(self.todos) + self.items_per_page - 1) // self.items_per_page
+            if total_pages > 1:
+                page_info = f"Page {self.current_page + 1}/{total_pages}"
+                page_x = (self.width - text_width(self.item_font, page_info)) // 2
+            self._page_cache = (key, page_info, page_x)
+        return self._page_cache[1], self._page_cache[2]
+
+    def _draw_frame(self, image: Image.Image, rows, battery, top: int = 0):
+        """
+        Draw everything below the title onto image
+
+        image may be a horizontal band of the screen starting at row top;
+        items that miss the band are skipped and the rest are shifted up, so
+        the band comes out the same as that slice of a full frame.
+        """
+        draw = ImageDraw.Draw(image)
+        bottom = top + image.height
+
+        # Draw battery status if available (top right corner)
+        if battery is not None:
+            # Use drawn battery icon instead of emoji (emojis show as boxes on e-ink)
+            self._draw_battery_icon(draw, self.width - 10, 10 - top, *battery)
 
         # If no todos, show message
         if not self.todos:
             message = "No tasks yet. Add one from the web interface!"
-            message_bbox = draw.textbbox((0, 0), message, font=self.item_font)
-            message_width = message_bbox[2] - message_bbox[0]
+            message_width = text_width(self.item_font, message)
             draw.text(
-                ((self.width - message_width) // 2, self.height // 2),
+                ((self.width - message_width) // 2, self.height // 2 - top),
                 message,
                 fill='gray',
                 font=self.item_font
             )
         else:
-            # Calculate pagination
-            start_idx = self.current_page * self.items_per_page
-            end_idx = min(start_idx + self.items_per_page, len(self.todos))
-            line_height = 40  # Increased from 24 for larger font
+            line_height = self.LINE_HEIGHT
+            line_spacing = self.LINE_SPACING
 
             # Draw todo items
-            for i in range(start_idx, end_idx):
+            for i, y_offset, lines in rows:
+                # Skip rows that can't reach the band (the highlight and
+                # descenders overhang the row's own height by less than a line)
+                if y_offset - 2 >= bottom or y_offset + max(line_height, (len(lines) + 1) * line_spacing) <= top:
+                    continue
                 todo = self.todos[i]
+                y_offset -= top
 
                 # Highlight current selection
                 if i == self.current_index:
-                    # Draw selection background
-                    draw.rectangle(
-                        [(10, y_offset - 2), (self.width - 10, y_offset + line_height - 2)],
-                        fill='lightgray'
-                    )
+                    # Fill the selection background in place (same pixels as
+                    # draw.rectangle, whose corners are inclusive)
+                    image.paste(self._highlight_fill,
+                                (10, y_offset - 2, self.width - 9, y_offset + line_height - 1))
 
                 # Draw checkbox - centered with text line
                 checkbox_x = 20
-                checkbox_size = 24  # Increased from 16 for better visibility
+                checkbox_size = self.CHECKBOX_SIZE
                 # Center checkbox vertically with text
-                text_bbox_temp = draw.textbbox((0, 0), "A", font=self.item_font)
-                text_height = text_bbox_temp[3] - text_bbox_temp[1]
-                checkbox_y = y_offset + (text_height - checkbox_size) // 2
-                
-                draw.rectangle(
-                    [(checkbox_x, checkbox_y), (checkbox_x + checkbox_size, checkbox_y + checkbox_size)],
-                    outline='black',
-                    width=2
-                )
-
-                # Draw X if completed
-                if todo['completed']:
-                    # Draw X in checkbox
-                    draw.line([(checkbox_x + 4, checkbox_y + 4), (checkbox_x + checkbox_size - 4, checkbox_y + checkbox_size - 4)], fill='black', width=3)
-                    draw.line([(checkbox_x + checkbox_size - 4, checkbox_y + 4), (checkbox_x + 4, checkbox_y + checkbox_size - 4)], fill='black', width=3)
+                checkbox_y = y_offset + (self._item_text_height - checkbox_size) // 2
+                draw.bitmap((checkbox_x, checkbox_y), self._checkbox_masks[bool(todo['completed'])], fill='black')
 
                 # Draw todo text - multi-line word wrap
                 text_x = checkbox_x + checkbox_size + 10
                 text_color = 'black'
-                max_width = self.width - text_x - 20
-                max_lines = 3  # Maximum lines per task
-                
-                # Word wrap implementation
-                text = todo['text']
-                words = text.split()
-                lines = []
-                current_line = []
-                
-                for word in words:
-                    # Test if adding this word would exceed max width
-                    test_line = ' '.join(current_line + [word])
-                    test_bbox = draw.textbbox((0, 0), test_line, font=self.item_font)
-                    test_width = test_bbox[2] - test_bbox[0]
-                    
-                    if test_width <= max_width:
-                        current_line.append(word)
-                    else:
-                        # Save current line if it has content
-                        if current_line:
-                            lines.append(' '.join(current_line))
-                            current_line = []
-                        
-                        # Check if single word is too long
-                        word_bbox = draw.textbbox((0, 0), word, font=self.item_font)
-                        word_width = word_bbox[2] - word_bbox[0]
-                        
-                        if word_width > max_width:
-                            # Truncate long word to fit
-                            truncated = word
-                            while len(truncated) > 0:
-                                test_word = truncated + "..."
-                                test_bbox = draw.textbbox((0, 0), test_word, font=self.item_font)
-                                if test_bbox[2] - test_bbox[0] <= max_width:
-                                    lines.append(test_word)
-                                    break
-                                truncated = truncated[:-1]
-                            current_line = []
-                        else:
-                            current_line = [word]
-                        
-                        # Stop if we've reached max lines
-                        if len(lines) >= max_lines:
-                            break
-                
-                # Add remaining words if we haven't hit max lines
-                if current_line and len(lines) < max_lines:
-                    lines.append(' '.join(current_line))
-                
-                # Limit to max_lines and add ellipsis if truncated
-                if len(lines) > max_lines:
-                    lines = lines[:max_lines]
-                    lines[-1] = lines[-1] + "..."
-                
-                # Draw each line
-                line_spacing = 36  # Spacing between lines
                 current_y = y_offset
-                
-                for i, line_text in enumerate(lines):
+
+                for line_text, ink_right, ink_height in lines:
                     draw.text((text_x, current_y), line_text, fill=text_color, font=self.item_font)
-                    
+
                     # Add strikethrough if completed (on all lines)
                     if todo['completed']:
-                        text_bbox = draw.textbbox((text_x, current_y), line_text, font=self.item_font)
-                        text_height = text_bbox[3] - text_bbox[1]
-                        strike_y = current_y + text_height // 2
-                        draw.line([(text_x, strike_y), (text_bbox[2], strike_y)], fill='black', width=4)
-                    
-                    current_y += line_spacing
+                        strike_y = current_y + ink_height // 2
+                        draw.line([(text_x, strike_y), (text_x + ink_right, strike_y)], fill='black', width=4)
 
-                # Adjust y_offset based on number of lines drawn
-                y_offset += max(line_height, len(lines) * line_spacing)
+                    current_y += line_spacing
 
             # Draw page indicator if multiple pages
-            total_pages = (len(self.todos) + self.items_per_page - 1) // self.items_per_page
-            if total_pages > 1:
-                page_info = f"Page {self.current_page + 1}/{total_pages}"
-                page_bbox = draw.textbbox((0, 0), page_info, font=self.item_font)
-                page_width = page_bbox[2] - page_bbox[0]
+            page_info, page_x = self._page_indicator()
+            if page_info:
                 draw.text(
-                    ((self.width - page_width) // 2, self.height - 60),
+                    (page_x, self.height - 60 - top),
                     page_info,
                     fill='gray',
                     font=self.item_font
                 )
 
-        # Draw help text at bottom (matching MainMenuScreen format)
-        help_text = "Hold: Main Menu"
-        try:
-            bbox = draw.textbbox((0, 0), help_text, font=self.font)
-            help_width = bbox[2] - bbox[0]
-        except:
-            help_width = len(help_text) * 8
+        # Stamp the help text last so it stays on top of long lists
+        help_x, help_y = self._help_pos
+        draw.bitmap((help_x, help_y - top), self._help_mask, fill='black')
+
+    def render(self) -> Image.Image:
+        """
+        Render the To Do screen
+
+        Returns:
+            PIL Image of the screen
+        """
+        # Reload todos to get latest from web interface
+        self._load_todos()
+
+        # Start from the pre-rendered title and separator
+        if self._base_key != (self.width, self.height):
+            self._build_base_image()
 
-        help_x = (self.width - help_width) // 2
-        draw.text((help_x, self.height - 40), help_text, font=self.font, fill='black')
+        battery = None
+        if self.battery_monitor:
+            try:
+                battery = (self.battery_monitor.get_percentage(), self.battery_monitor.is_charging())
+            except Exception as e:
+                self.logger.warning(f"Failed to get battery status: {e}")
+
+        rows = self._layout_rows()
+        state = (self._todos_version, self.current_page, self.items_per_page, battery, self._base_key)
+
+        if state == self._last_rendered:
+            # Only the selection can have moved: repaint the old and new
+            # highlight bands from the base image instead of the whole list
+            image = self._last_image.copy()
+            if self.current_index != self._last_index:
+                for i, y_offset, _ in rows:
+                    if i not in (self._last_index, self.current_index):
+                        continue
+                    top = y_offset - 2
+                    band = self._base_image.crop((0, top, self.width, top + self.LINE_HEIGHT + 1))
+                    self._draw_frame(band, rows, battery, top)
+                    image.paste(band, (0, top))
+        else:
+            image = self._base_image.copy()
+            self._draw_frame(image, rows, battery)
 
+        self._last_image = image.copy()
+        self._last_rendered = state
+        self._last_index = self.current_index
         return image
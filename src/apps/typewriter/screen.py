@@ -10,12 +10,16 @@ Features:
 
 import logging
 import os
+import selectors
 import subprocess
 import json
+import time
 from typing import Optional, List, Tuple
 from PIL import Image, ImageDraw, ImageFont
 from datetime import datetime
 
+from src.utils.fonts import get_default_font, text_mask, text_width
+
 
 class TypewriterScreen:
     """
@@ -26,6 +30,11 @@ class TypewriterScreen:
     MODE_TERMINAL = 0
     MODE_WORDPROC = 1
 
+    COMMAND_TIMEOUT = 30  # Seconds before a terminal command is killed
+    OUTPUT_READ_LIMIT = 1 << 20  # Bytes of stdout/stderr kept per command; the rest is discarded
+    MAX_OUTPUT_CHARS = 8192  # Output stored per history entry
+    MAX_HISTORY = 200  # History entries kept; older ones are dropped
+
     def __init__(self, width: int = 800, height: int = 480, font_size: int = 16, battery_monitor=None):
         """
         Initialize Typewriter screen
@@ -69,15 +78,23 @@ class TypewriterScreen:
         # Terminal state
         self.terminal_input = ""
         self.terminal_history: List[Tuple[str, str]] = []  # List of (command, output) tuples
+        self._terminal_total_lines = 1  # Lines in history plus the input line, kept as entries are added
+        # Wrapped (type, text) lines for the first _wrapped_history_len history
+        # entries, extended as commands run; prompts start with _wrapped_prompt
+        self._wrapped_history: List[Tuple[str, str]] = []
+        self._wrapped_history_len = 0
+        self._wrapped_prompt = None
         self.terminal_scroll = 0
-        self.current_dir = os.path.expanduser("~")
+        self._home = os.path.expanduser("~")
+        self.current_dir = self._home
+        self._prompt_prefix = os.path.basename(self.current_dir) + "$ "  # Refreshed on cd
 
         # Word processor state
         self.document_lines: List[str] = [""]  # Start with one empty line
         self.cursor_line = 0
         self.cursor_col = 0
         self.wp_scroll = 0  # Scroll offset for word processor
-        self.document_path = os.path.expanduser("~/PiBook/data/documents")
+        self.document_path = os.path.join(self._home, "PiBook/data/documents")
         self.current_document = None
 
         # Ensure documents directory exists
@@ -94,6 +111,26 @@ class TypewriterScreen:
         self.content_width = width - (self.margin * 2)
         self.chars_per_line = self.content_width // self.char_width
 
+        # Static header/footer layout: tab rectangles with their label
+        # positions, and the footer position and terminal help text
+        tab_width = 150
+        tab_height = 35
+        tab_y = 8
+        term_x = 20
+        wp_x = term_x + tab_width + 10
+        self._tabs = (
+            (self.MODE_TERMINAL, [(term_x, tab_y), (term_x + tab_width, tab_y + tab_height)],
+             (term_x + 30, tab_y + 8), "Terminal"),
+            (self.MODE_WORDPROC, [(wp_x, tab_y), (wp_x + tab_width, tab_y + tab_height)],
+             (wp_x + 15, tab_y + 8), "Word Proc"),
+        )
+        self._footer_y = height - self.footer_height
+        self._terminal_help = "Alt: Switch Tab | Enter: Execute | Esc: Main Menu"
+
+        # Blank frame with the header drawn, rebuilt when _header_key changes
+        self._header_key = None
+        self._header_image: Optional[Image.Image] = None
+
         self.logger.info(f"TypewriterScreen initialized: {self.chars_per_line} chars/line, {self.visible_lines} lines visible")
 
     def toggle_mode(self):
@@ -127,64 +164,123 @@ class TypewriterScreen:
         # Handle built-in commands
         if command == "clear":
             self.terminal_history = []
+            self._terminal_total_lines = 1
+            self._wrapped_history = []
+            self._wrapped_history_len = 0
             return
 
         if command.startswith("cd "):
             new_dir = command[3:].strip()
             if new_dir == "~":
-                new_dir = os.path.expanduser("~")
+                new_dir = self._home
             elif not new_dir.startswith("/"):
                 new_dir = os.path.join(self.current_dir, new_dir)
 
-            if os.path.isdir(new_dir):
-                self.current_dir = os.path.abspath(new_dir)
-                self.terminal_history.append((command, f"Changed to {self.current_dir}"))
+            # Normalise once, then a single stat
+            target = os.path.abspath(new_dir)
+            if os.path.isdir(target):
+                self.current_dir = target
+                self._prompt_prefix = os.path.basename(self.current_dir) + "$ "
+                self._add_history(command, f"Changed to {self.current_dir}")
             else:
-                self.terminal_history.append((command, f"Directory not found: {new_dir}"))
+                self._add_history(command, f"Directory not found: {new_dir}")
             return
 
         # Execute shell command
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=self.current_dir,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            output = result.stdout + result.stderr
+            output = self._run_command(command)
             if not output:
                 output = "(no output)"
         except subprocess.TimeoutExpired:
-            output = "Command timed out (30s limit)"
+            output = f"Command timed out ({self.COMMAND_TIMEOUT}s limit)"
         except Exception as e:
             output = f"Error: {str(e)}"
 
-        self.terminal_history.append((command, output.strip()))
+        self._add_history(command, output.strip())
 
         # Scroll to bottom
         self._terminal_scroll_to_bottom()
 
         self.logger.info(f"Terminal executed: {command}")
 
+    def _run_command(self, command: str) -> str:
+        """
+        Run a shell command and return its stdout followed by its stderr
+
+        Both pipes are drained in 64 KiB reads until the command exits, but
+        only the first OUTPUT_READ_LIMIT bytes of each are kept, so commands
+        like `ls -R /` can't pile megabytes of unreachable output into the
+        history. Raises subprocess.TimeoutExpired (after killing the command)
+        if it runs past COMMAND_TIMEOUT.
+        """
+        proc = subprocess.Popen(command, shell=True, cwd=self.current_dir,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        kept = {proc.stdout: [], proc.stderr: []}
+        room = {proc.stdout: self.OUTPUT_READ_LIMIT, proc.stderr: self.OUTPUT_READ_LIMIT}
+        deadline = time.monotonic() + self.COMMAND_TIMEOUT
+
+        try:
+            with selectors.DefaultSelector() as selector:
+                for pipe in kept:
+                    selector.register(pipe, selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(command, self.COMMAND_TIMEOUT)
+                    for key, _ in selector.select(remaining):
+                        data = os.read(key.fd, 65536)
+                        if not data:
+                            selector.unregister(key.fileobj)
+                            continue
+                        if room[key.fileobj] > 0:
+                            kept[key.fileobj].append(data[:room[key.fileobj]])
+                            room[key.fileobj] -= len(data)
+            proc.wait(timeout=max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            proc.stdout.close()
+            proc.stderr.close()
+
+        # Decode like text=True would, minus failing on invalid UTF-8
+        output = b''.join(kept[proc.stdout]) + b''.join(kept[proc.stderr])
+        return output.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+
+    def _add_history(self, command: str, output: str):
+        """Append a command and its output, keeping the line count current"""
+        if len(output) > self.MAX_OUTPUT_CHARS:
+            output = output[:self.MAX_OUTPUT_CHARS] + "\n...(truncated)"
+        self.terminal_history.append((command, output))
+        self._terminal_total_lines += self._lines_for_entry(command, output)
+
+        # Drop the oldest entries, along with their lines and wrapped lines
+        if len(self.terminal_history) > self.MAX_HISTORY:
+            dropped = self.terminal_history[:-self.MAX_HISTORY]
+            del self.terminal_history[:-self.MAX_HISTORY]
+            for old_command, old_output in dropped:
+                lines = self._lines_for_entry(old_command, old_output)
+                self._terminal_total_lines -= lines
+                self.terminal_scroll = max(0, self.terminal_scroll - lines)
+                if self._wrapped_history_len:
+                    wrapped = self._wrap_entry(self._wrapped_prompt, old_command, old_output)
+                    del self._wrapped_history[:len(wrapped)]
+                    self._wrapped_history_len -= 1
+
+    def _lines_for_entry(self, command: str, output: str) -> int:
+        """Count the lines one history entry takes up"""
+        count = 1  # Command prompt line
+        for line in output.split('\n'):
+            count += (len(line) // self.chars_per_line) + 1
+        return count
+
     def _terminal_scroll_to_bottom(self):
         """Scroll terminal to show latest output"""
-        total_lines = self._count_terminal_lines()
+        total_lines = self._terminal_total_lines
         if total_lines > self.visible_lines:
             self.terminal_scroll = total_lines - self.visible_lines
 
-    def _count_terminal_lines(self) -> int:
-        """Count total lines in terminal history"""
-        count = 0
-        for cmd, output in self.terminal_history:
-            count += 1  # Command prompt line
-            output_lines = output.split('\n')
-            for line in output_lines:
-                count += (len(line) // self.chars_per_line) + 1
-        count += 1  # Current input line
-        return count
-
     def terminal_scroll_up(self):
         """Scroll terminal output up"""
         if self.terminal_scroll > 0:
@@ -192,7 +288,7 @@ class TypewriterScreen:
 
     def terminal_scroll_down(self):
         """Scroll terminal output down"""
-        total_lines = self._count_terminal_lines()
+        total_lines = self._terminal_total_lines
         if self.terminal_scroll < total_lines - self.visible_lines:
             self.terminal_scroll += 1
 
@@ -424,54 +520,28 @@ class TypewriterScreen:
             draw.polygon(bolt_points, fill=1, outline=0)
 
         percentage_text = f"{percentage}%"
-        font = ImageFont.load_default()
+        font = get_default_font()
         try:
-            bbox = draw.textbbox((0, 0), percentage_text, font=font)
-            text_width = bbox[2] - bbox[0]
+            percentage_width = text_width(font, percentage_text, '1')
         except:
-            text_width = len(percentage_text) * 8
+            percentage_width = len(percentage_text) * 8
 
-        text_x = battery_x - text_width - 5
+        text_x = battery_x - percentage_width - 5
         draw.text((text_x, y), percentage_text, font=font, fill=0)
 
-    def _render_header(self, draw: ImageDraw.Draw):
-        """Render header with tabs and battery"""
+    def _render_header(self, draw: ImageDraw.Draw, battery: Optional[Tuple[int, bool]]):
+        """Render header with tabs and battery ((percentage, charging) or None)"""
         # Draw tab bar background (1-bit: 0=black, 1=white)
         draw.rectangle([(0, 0), (self.width, self.header_height - 5)], fill=1)
 
-        # Draw tabs
-        tab_width = 150
-        tab_height = 35
-        tab_y = 8
-
-        # Terminal tab
-        term_x = 20
-        if self.current_mode == self.MODE_TERMINAL:
-            draw.rectangle([(term_x, tab_y), (term_x + tab_width, tab_y + tab_height)],
-                          fill=1, outline=0, width=2)
-        else:
-            draw.rectangle([(term_x, tab_y), (term_x + tab_width, tab_y + tab_height)],
-                          fill=1, outline=0, width=1)
-        draw.text((term_x + 30, tab_y + 8), "Terminal", font=self.title_font, fill=0)
-
-        # Word Processor tab
-        wp_x = term_x + tab_width + 10
-        if self.current_mode == self.MODE_WORDPROC:
-            draw.rectangle([(wp_x, tab_y), (wp_x + tab_width, tab_y + tab_height)],
-                          fill=1, outline=0, width=2)
-        else:
-            draw.rectangle([(wp_x, tab_y), (wp_x + tab_width, tab_y + tab_height)],
-                          fill=1, outline=0, width=1)
-        draw.text((wp_x + 15, tab_y + 8), "Word Proc", font=self.title_font, fill=0)
+        # Draw tabs, the current one with a heavier outline
+        for mode, rect, label_xy, label in self._tabs:
+            draw.rectangle(rect, fill=1, outline=0, width=2 if mode == self.current_mode else 1)
+            draw.text(label_xy, label, font=self.title_font, fill=0)
 
         # Battery icon
-        if self.battery_monitor:
-            try:
-                pct = self.battery_monitor.get_percentage()
-                charging = self.battery_monitor.is_charging()
-                self._draw_battery_icon(draw, self.width - 10, 10, pct, charging)
-            except:
-                pass
+        if battery is not None:
+            self._draw_battery_icon(draw, self.width - 10, 10, *battery)
 
         # Separator line
         draw.line([(0, self.header_height - 1), (self.width, self.header_height - 1)],
@@ -479,55 +549,79 @@ class TypewriterScreen:
 
     def _render_footer(self, draw: ImageDraw.Draw):
         """Render footer with help text"""
-        footer_y = self.height - self.footer_height
+        footer_y = self._footer_y
 
         # Separator line
         draw.line([(0, footer_y), (self.width, footer_y)], fill=0, width=1)
 
         if self.current_mode == self.MODE_TERMINAL:
-            help_text = "Alt: Switch Tab | Enter: Execute | Esc: Main Menu"
+            help_text = self._terminal_help
         else:
             word_count = self.wp_get_word_count()
             help_text = f"Alt: Switch Tab | Ctrl+S: Save | Words: {word_count} | Esc: Menu"
 
+        # Word count changes as you type, so a cached line mask would rarely hit
         draw.text((self.margin, footer_y + 8), help_text, font=self.small_font, fill=0)
 
+    def _blit_text(self, draw: ImageDraw.Draw, x: int, y: int, text: str, font: ImageFont.ImageFont):
+        """
+        Draw a line of text in black from its cached 1-bit mask
+
+        Only for lines that are redrawn unchanged (history, untouched
+        document lines); the line being typed uses draw.text.
+        """
+        mask, dx, dy = text_mask(font, text)
+        if mask.width and mask.height:
+            draw.bitmap((x + dx, y + dy), mask, fill=0)
+
+    def _wrap_entry(self, prompt: str, cmd: str, output: str) -> List[Tuple[str, str]]:
+        """Wrap one history entry into (type, text) display lines"""
+        # Prompt line
+        lines = [('prompt', prompt + cmd)]
+
+        # Output lines (wrap long lines, slicing each chunk straight out of
+        # the line rather than re-copying the remainder per chunk)
+        width = self.chars_per_line
+        for out_line in output.split('\n'):
+            if len(out_line) <= width:
+                lines.append(('output', out_line))
+            else:
+                lines.extend([('output', out_line[i:i + width]) for i in range(0, len(out_line), width)])
+        return lines
+
     def _render_terminal(self, draw: ImageDraw.Draw):
         """Render terminal content"""
         y = self.header_height + 5
-        line_num = 0
-
-        # Build all lines
-        all_lines = []
-        for cmd, output in self.terminal_history:
-            # Prompt line
-            prompt = f"{os.path.basename(self.current_dir)}$ {cmd}"
-            all_lines.append(('prompt', prompt))
-
-            # Output lines (wrap long lines)
-            for out_line in output.split('\n'):
-                while len(out_line) > self.chars_per_line:
-                    all_lines.append(('output', out_line[:self.chars_per_line]))
-                    out_line = out_line[self.chars_per_line:]
-                all_lines.append(('output', out_line))
+        prompt = self._prompt_prefix
+
+        # Wrap only entries added since the last frame - every prompt shows
+        # the current directory, so start over after a cd
+        if prompt != self._wrapped_prompt:
+            self._wrapped_history = []
+            self._wrapped_history_len = 0
+            self._wrapped_prompt = prompt
+        for cmd, output in self.terminal_history[self._wrapped_history_len:]:
+            self._wrapped_history.extend(self._wrap_entry(prompt, cmd, output))
+        self._wrapped_history_len = len(self.terminal_history)
+        history_lines = self._wrapped_history
 
         # Current input line
-        prompt = f"{os.path.basename(self.current_dir)}$ {self.terminal_input}_"
-        all_lines.append(('input', prompt))
+        input_line = ('input', prompt + self.terminal_input + "_")
 
         # Render visible lines
         start_line = self.terminal_scroll
-        end_line = min(start_line + self.visible_lines, len(all_lines))
+        end_line = min(start_line + self.visible_lines, len(history_lines) + 1)
 
         for i in range(start_line, end_line):
-            line_type, text = all_lines[i]
+            line_type, text = history_lines[i] if i < len(history_lines) else input_line
 
             if line_type == 'prompt':
-                draw.text((self.margin, y), text, font=self.mono_bold, fill=0)
+                self._blit_text(draw, self.margin, y, text, self.mono_bold)
             elif line_type == 'input':
+                # Changes with every keystroke - a cached mask would never hit
                 draw.text((self.margin, y), text, font=self.mono_bold, fill=0)
             else:
-                draw.text((self.margin, y), text, font=self.mono_font, fill=0)
+                self._blit_text(draw, self.margin, y, text, self.mono_font)
 
             y += self.char_height
 
@@ -541,14 +635,17 @@ class TypewriterScreen:
 
         for i in range(start_line, end_line):
             line = self.document_lines[i]
-
-            # Draw cursor if on this line
             if i == self.cursor_line:
-                # Insert cursor character
-                display_line = line[:self.cursor_col] + "|" + line[self.cursor_col:]
-                draw.text((self.margin, y), display_line, font=self.mono_font, fill=0)
+                # The line being edited changes with every keystroke
+                draw.text((self.margin, y), line, font=self.mono_font, fill=0)
             else:
-                draw.text((self.margin, y), line if line else " ", font=self.mono_font, fill=0)
+                self._blit_text(draw, self.margin, y, line, self.mono_font)
+
+            # Draw cursor if on this line - a bar in the gap before the
+            # character cell, so the text after it doesn't shift over
+            if i == self.cursor_line:
+                cursor_x = self.margin + self.cursor_col * self.char_width - 1
+                draw.line([(cursor_x, y), (cursor_x, y + self.char_height - 2)], fill=0, width=1)
 
             y += self.char_height
 
@@ -556,11 +653,10 @@ class TypewriterScreen:
         if self.current_document:
             doc_text = f"[{self.current_document}]"
             try:
-                bbox = draw.textbbox((0, 0), doc_text, font=self.small_font)
-                text_width = bbox[2] - bbox[0]
+                doc_width = text_width(self.small_font, doc_text, '1')
             except:
-                text_width = len(doc_text) * 8
-            draw.text((self.width - text_width - self.margin, self.header_height + 5),
+                doc_width = len(doc_text) * 8
+            draw.text((self.width - doc_width - self.margin, self.header_height + 5),
                      doc_text, font=self.small_font, fill=0)
 
     def render(self) -> Image.Image:
@@ -570,12 +666,24 @@ class TypewriterScreen:
         Returns:
             PIL Image of the screen (1-bit for fast partial refresh)
         """
-        # Create 1-bit image for fast partial refresh on e-ink
-        image = Image.new('1', (self.width, self.height), 1)  # 1 = white
+        battery = None
+        if self.battery_monitor:
+            try:
+                battery = (self.battery_monitor.get_percentage(), self.battery_monitor.is_charging())
+            except:
+                pass
+
+        # The header only changes with the tab and battery, so start from a
+        # 1-bit frame with it pre-drawn and repaint just the body and footer
+        header_key = (self.current_mode, battery, self.width, self.height)
+        if header_key != self._header_key:
+            self._header_image = Image.new('1', (self.width, self.height), 1)  # 1 = white
+            self._render_header(ImageDraw.Draw(self._header_image), battery)
+            self._header_key = header_key
+        image = self._header_image.copy()
         draw = ImageDraw.Draw(image)
 
         # Render components
-        self._render_header(draw)
 
         if self.current_mode == self.MODE_TERMINAL:
             self._render_terminal(draw)
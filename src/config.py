@@ -6,9 +6,21 @@ PORTABILITY: 100% portable between Pi 3B+ and Pi Zero 2 W
 
 import yaml
 import os
+import shutil
+import tempfile
 from typing import Any, Dict
 import logging
 
+try:
+    # libyaml-backed parser, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+_MISSING = object()    # Path not looked up yet
+_NOT_FOUND = object()  # Path looked up and not in the config
+
 
 class Config:
     """
@@ -29,11 +41,14 @@ class Config:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         with open(config_path, 'r') as f:
-            self._config = yaml.safe_load(f)
+            self._config = yaml.load(f, Loader=_SafeLoader)
 
         # Expand environment variables in paths
         self._expand_paths(self._config)
 
+        # Lookups by dotted path, cleared whenever set() changes the config
+        self._value_cache: Dict[str, Any] = {}
+
         self.logger.info(f"Configuration loaded from {config_path}")
 
     def _expand_paths(self, config: Dict):
@@ -55,15 +70,19 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = path.split('.')
-        value = self._config
+        value = self._value_cache.get(path, _MISSING)
+        if value is not _MISSING:
+            return default if value is _NOT_FOUND else value
 
-        for key in keys:
+        value = self._config
+        for key in path.split('.'):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
+                self._value_cache[path] = _NOT_FOUND
                 return default
 
+        self._value_cache[path] = value
         return value
 
     def set(self, path: str, value: Any):
@@ -83,6 +102,7 @@ class Config:
             config = config[key]
 
         config[keys[-1]] = value
+        self._value_cache.clear()
         self.logger.debug(f"Config set: {path} = {value}")
 
     def save(self, config_path: str = None):
@@ -95,8 +115,30 @@ class Config:
         if config_path is None:
             config_path = self.config_path
 
-        with open(config_path, 'w') as f:
-            yaml.safe_dump(self._config, f, default_flow_style=False)
+        # Dump to a temp file in the same directory and swap it in atomically,
+        # so an interrupted write never leaves a truncated config behind
+        config_dir = os.path.dirname(os.path.abspath(config_path))
+        with tempfile.NamedTemporaryFile('w', dir=config_dir, suffix='.tmp',
+                                         delete=False, encoding='utf-8') as tmp:
+            try:
+                yaml.safe_dump(self._config, tmp, default_flow_style=False)
+            except Exception:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        try:
+            # NamedTemporaryFile creates the file 0600 - keep the config's own
+            # mode, or what a plain open() would give a new file
+            try:
+                shutil.copymode(config_path, tmp.name)
+            except FileNotFoundError:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp.name, 0o666 & ~umask)
+            os.replace(tmp.name, config_path)
+        except Exception:
+            os.unlink(tmp.name)
+            raise
 
         self.logger.info(f"Configuration saved to {config_path}")
 
@@ -176,12 +176,12 @@ class DisplayDriver:
                         self.epd.init()
                         self.partial_mode_initialized = False
 
-                    self.epd.display(self.epd.getbuffer(image))
+                    self.epd.display(self._getbuffer(image))
                     self.partial_refresh_count = 0
                     self.first_display = False  # Clear first display flag after full refresh
                 else:
                     # Partial refresh - faster but may cause ghosting
-                    buffer_data = self.epd.getbuffer(image)
+                    buffer_data = self._getbuffer(image)
 
                     # Waveshare 7.5" V2 uses display_Partial(Image, Xstart, Ystart, Xend, Yend)
                     if hasattr(self.epd, 'display_Partial'):
@@ -227,6 +227,20 @@ class DisplayDriver:
             self.logger.error(f"Display image failed: {e}")
             raise
 
+    def _getbuffer(self, image: Image.Image) -> bytearray:
+        """
+        Pack a 1-bit image into the panel's frame buffer
+
+        Produces the same bytes as epd.getbuffer() - PIL's packed bits with
+        every byte inverted, since the panel uses 1 for black - but packs
+        them inverted in C via the '1;I' raw mode instead of XOR-ing 48000
+        bytes in a Python loop. Images not already at the hardware size are
+        left to the Waveshare implementation.
+        """
+        if image.mode == '1' and image.size == (self.hw_width, self.hw_height):
+            return bytearray(image.tobytes('raw', '1;I'))
+        return self.epd.getbuffer(image)
+
     def set_full_refresh_interval(self, interval: int):
         """
         Set how many partial refreshes before a full refresh
@@ -494,12 +494,14 @@ class PiBookApp:
                 if self.navigation.is_on_screen(Screen.IP_SCANNER) and not self.power_manager.is_sleeping:
                     current_scanning = self.ip_scanner_screen.scanning
 
-                    # Refresh if currently scanning OR just finished scanning
-                    if current_scanning or (last_scanning_state and not current_scanning):
+                    # Refresh once when scanning just finished, or while scanning
+                    # if the frame would actually change (each refresh is costly)
+                    just_finished = last_scanning_state and not current_scanning
+                    if just_finished or (current_scanning and self.ip_scanner_screen.needs_render()):
                         try:
                             # Force partial refresh during scanning (no full refresh needed)
                             self._render_current_screen(force_partial=True)
-                            if not current_scanning and last_scanning_state:
+                            if just_finished:
                                 self.logger.info("IP scan completed - final refresh done")
                         except Exception as scan_error:
                             self.logger.error(f"Error refreshing IP scanner: {scan_error}", exc_info=True)
@@ -512,7 +514,7 @@ class PiBookApp:
                     current_klipper_scanning = self.klipper_screen.scanning
 
                     # --- Periodic status refresh (every 3 minutes) ---
-                    klipper_has_printers = len(self.klipper_screen.printers) > 0
+                    klipper_has_printers = self.klipper_screen.printer_count > 0
                     if klipper_has_printers and not current_klipper_scanning:
                         elapsed = current_time - self.klipper_screen.last_status_refresh
                         if (self.klipper_screen.last_status_refresh == 0 or
@@ -634,10 +636,10 @@ class PiBookApp:
             self.todo_screen.next_item()
         elif self.navigation.is_on_screen(Screen.KLIPPER):
             # Start scan if no results yet, otherwise scroll pages
-            if len(self.klipper_screen.printers) == 0 and not self.klipper_screen.scanning:
+            if self.klipper_screen.printer_count == 0 and not self.klipper_screen.scanning:
                 self.logger.info("🖨️ Action: NEXT - Starting Klipper scan")
                 self.klipper_screen.start_scan()
-            elif not self.klipper_screen.scanning and len(self.klipper_screen.printers) > 0:
+            elif not self.klipper_screen.scanning and self.klipper_screen.printer_count > 0:
                 self.logger.info("🖨️ Action: NEXT (Klipper - Next page)")
                 self.klipper_screen.next_page()
             else:
@@ -11,6 +11,8 @@ import logging
 import socket
 import subprocess
 
+from src.utils.fonts import get_font, get_default_font
+
 
 def get_ip_address():
     """Get the Pi's local IP address"""
@@ -895,13 +897,13 @@ class ReaderScreen:
         image = Image.new('1', (self.width, self.height), 255)
         draw = ImageDraw.Draw(image)
 
-        # Load font
+        # Fonts come from the shared cache - this runs once per progress update
         try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-            small_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
+            font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
+            small_font = get_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
         except:
-            font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
+            font = get_default_font()
+            small_font = get_default_font()
 
         # Draw title
         try:
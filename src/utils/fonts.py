@@ -0,0 +1,64 @@
+"""
+Shared font cache so screens don't re-parse the same TTF files.
+"""
+
+import functools
+from typing import Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+
+@functools.lru_cache(maxsize=32)
+def get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, reusing the instance for repeated (path, size) pairs
+
+    Raises the same errors as ImageFont.truetype() so callers can fall back
+    to get_default_font().
+    """
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_font() -> ImageFont.ImageFont:
+    """Load PIL's built-in bitmap font once"""
+    return ImageFont.load_default()
+
+
+# Scratch surfaces for measuring text outside of a frame being drawn, one
+# per image mode - 1-bit drawing disables antialiasing, which changes metrics
+_measure_draws = {mode: ImageDraw.Draw(Image.new(mode, (1, 1))) for mode in ('L', '1')}
+
+
+@functools.lru_cache(maxsize=512)
+def text_width(font: ImageFont.ImageFont, text: str, mode: str = 'L') -> int:
+    """
+    Width in pixels of text rendered with font, cached per (font, text, mode)
+
+    mode is the image mode the text will be drawn in ('L' or '1'). Font
+    objects hash by identity, and the cache holds a reference to each, so
+    entries stay valid for the life of the process.
+    """
+    bbox = _measure_draws[mode].textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0]
+
+
+@functools.lru_cache(maxsize=256)
+def text_mask(font: ImageFont.ImageFont, text: str, mode: str = '1') -> Tuple[Image.Image, int, int]:
+    """
+    Rasterize text once into a coverage mask, cached per (font, text, mode)
+
+    Returns (mask, dx, dy). draw.bitmap((x + dx, y + dy), mask, fill=ink)
+    puts down the same pixels as draw.text((x, y), text, font=font,
+    fill=ink) on a mode image, without going back to FreeType. Glyphs are
+    cached as whole strings because FreeType places each one relative to the
+    string it is in, so per-glyph stamps can be a pixel off.
+
+    A miss costs about as much as one draw.text call, so only use this for
+    lines that are drawn again unchanged.
+    """
+    # FreeType's mask is already the coverage map ('L', 0/255 in 1-bit
+    # mode) - wrap it in an Image rather than rasterizing the text again
+    core, (dx, dy) = font.getmask2(text, mode=mode)
+    if not (core.size[0] and core.size[1]):
+        return Image.new('L', core.size, 0), dx, dy
+    return Image.frombytes('L', core.size, bytes(core)), dx, dy
@@ -232,7 +232,8 @@ class PiBookWebServer:
 
                 scanner = self.app_instance.ip_scanner_screen
                 return jsonify({
-                    'scanning': scanner.scanning,
+                    # Still busy until hostnames/port 80 status are filled in
+                    'scanning': scanner.scanning or scanner.enriching,
                     'progress': scanner.scan_progress,
                     'devices': scanner.devices,
                     'local_ip': get_ip_address()
@@ -247,7 +248,7 @@ class PiBookWebServer:
             try:
                 scanner = self.app_instance.ip_scanner_screen
 
-                if scanner.scanning:
+                if scanner.scanning or scanner.enriching:
                     return jsonify({'status': 'already_scanning'})
 
                 scanner.start_scan()
@@ -290,16 +291,16 @@ class PiBookWebServer:
                         scanner.start_scan()
                         # Wait for scan to complete
                         import time
-                        while scanner.scanning:
+                        while scanner.scanning or scanner.enriching:
                             time.sleep(0.5)
 
-                    # Check each device for Klipper (port 80 and 7125)
-                    for device in scanner.devices:
-                        ip = device['ip']
+                    # Check every device for Moonraker (port 7125) in one pass
+                    devices = scanner.devices
+                    moonraker_ips = self._find_open_ports([d['ip'] for d in devices], 7125)
 
-                        # Check if port 7125 (Moonraker API) is open
-                        if self._check_port(ip, 7125):
-                            printer_info = self._get_klipper_info(ip, device.get('hostname', ''))
+                    for device in devices:
+                        if device['ip'] in moonraker_ips:
+                            printer_info = self._get_klipper_info(device['ip'], device.get('hostname', ''))
                             if printer_info:
                                 self.klipper_printers.append(printer_info)
 
@@ -1018,17 +1019,56 @@ class PiBookWebServer:
                 self.logger.error(f"Failed to get system stats: {e}")
                 return jsonify({'error': str(e)}), 500
 
-    def _check_port(self, ip: str, port: int) -> bool:
-        """Check if a port is open on the given IP"""
+    def _find_open_ports(self, ips: list, port: int, timeout: float = 2.0) -> set:
+        """
+        Return the IPs from ips that accept TCP connections on port
+
+        All connects are started non-blocking up front and completed from a
+        single selector loop, so the whole sweep costs one timeout rather
+        than one per host.
+        """
+        import errno
+        import selectors
         import socket
+        import time
+
+        open_ips = set()
+        selector = selectors.DefaultSelector()
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((ip, port))
-            sock.close()
-            return result == 0
-        except:
-            return False
+            for ip in ips:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                try:
+                    result = sock.connect_ex((ip, port))
+                except OSError:
+                    sock.close()
+                    continue
+                if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    selector.register(sock, selectors.EVENT_WRITE, ip)
+                    continue
+                if result == 0:
+                    open_ips.add(ip)
+                sock.close()
+
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj
+                    # SO_ERROR is 0 once the handshake completed, else e.g. ECONNREFUSED
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        open_ips.add(key.data)
+                    selector.unregister(sock)
+                    sock.close()
+        finally:
+            # Hosts that never answered within the timeout
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+
+        return open_ips
 
     def _get_klipper_info(self, ip: str, hostname: str = '') -> dict:
         """Get Klipper printer info from Moonraker API"""
@@ -1056,7 +1096,7 @@ class PiBookWebServer:
                 req = urllib.request.Request(f"{base_url}/server/info", method='GET')
                 req.add_header('Content-Type', 'application/json')
                 with urllib.request.urlopen(req, timeout=5) as response:
-                    data = json_lib.loads(response.read().decode())
+                    data = json_lib.loads(response.read())
                     if 'result' in data:
                         printer_info['klipper_version'] = data['result'].get('klippy_state', 'unknown')
             except Exception as e:
@@ -1067,7 +1107,7 @@ class PiBookWebServer:
                 req = urllib.request.Request(f"{base_url}/printer/info", method='GET')
                 req.add_header('Content-Type', 'application/json')
                 with urllib.request.urlopen(req, timeout=5) as response:
-                    data = json_lib.loads(response.read().decode())
+                    data = json_lib.loads(response.read())
                     if 'result' in data:
                         printer_info['state'] = data['result'].get('state', 'unknown')
             except Exception as e:
@@ -1081,7 +1121,7 @@ class PiBookWebServer:
                 )
                 req.add_header('Content-Type', 'application/json')
                 with urllib.request.urlopen(req, timeout=5) as response:
-                    data = json_lib.loads(response.read().decode())
+                    data = json_lib.loads(response.read())
                     if 'result' in data and 'status' in data['result']:
                         status = data['result']['status']
 
@@ -0,0 +1,91 @@
+"""
+Unit tests for configuration loading and lookups
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Config
+
+
+CONFIG_YAML = """\
+display:
+  width: 800
+  height: 480
+power:
+  sleep_timeout: 300
+"""
+
+
+def _write_config(tmp: str) -> str:
+    path = Path(tmp) / 'config.yaml'
+    path.write_text(CONFIG_YAML)
+    return str(path)
+
+
+def test_get_cache():
+    """Test cached lookups stay correct for misses, defaults and set()"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Config(_write_config(tmp))
+
+        assert config.get('display.width') == 800
+        assert config.get('display.width') == 800
+        assert config.get('display') == {'width': 800, 'height': 480}
+
+        # Misses keep honouring each caller's default
+        assert config.get('web.port', 5000) == 5000
+        assert config.get('web.port') is None
+        assert config.get('display.width.bogus', 'x') == 'x', "Can't descend into a value"
+
+        config.set('web.port', 8080)
+        config.set('display.width', 400)
+        assert config.get('web.port', 5000) == 8080, "set() must invalidate cached misses"
+        assert config.get('display.width') == 400
+        assert config.get('display')['width'] == 400
+
+    print("✓ Config lookup cache")
+
+
+def test_save_keeps_mode():
+    """Test saving keeps the file's permissions and leaves no temp files"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_config(tmp)
+        os.chmod(path, 0o664)
+        config = Config(path)
+        config.set('display.width', 400)
+        config.save()
+        assert os.stat(path).st_mode & 0o777 == 0o664, "Saving must not reset the mode to 0600"
+        assert Config(path).get('display.width') == 400
+
+        # A failed swap cleans up its temp file
+        target = os.path.join(tmp, 'dir_in_the_way')
+        os.mkdir(target)
+        try:
+            config.save(target)
+            assert False, "Replacing a directory should fail"
+        except OSError:
+            pass
+        assert sorted(os.listdir(tmp)) == ['config.yaml', 'dir_in_the_way'], "Temp file must be removed"
+
+    print("✓ Config save keeps mode")
+
+
+if __name__ == '__main__':
+    print("Running Config tests...\n")
+
+    try:
+        test_get_cache()
+        test_save_keeps_mode()
+
+        print("\n" + "="*50)
+        print("ALL TESTS PASSED ✓")
+        print("="*50)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
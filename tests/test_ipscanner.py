@@ -0,0 +1,308 @@
+"""
+Unit tests for IP scanner output parsing
+"""
+
+import ipaddress
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.apps.ipscanner import screen as ipscanner_screen
+from src.apps.ipscanner.screen import IPScannerScreen, DeviceTable, _read_proc_arp, _probe_order
+
+
+ARP_SCAN_OUTPUT = (
+    b"Interface: wlan0, type: EN10MB, MAC: b8:27:eb:00:00:01, IPv4: 192.168.1.5\n"
+    b"Starting arp-scan 1.9.7 with 256 hosts (https://github.com/royhills/arp-scan)\n"
+    b"192.168.1.1\t00:11:22:33:44:55\tNETGEAR\n"
+    b"192.168.1.20\taa:bb:cc:dd:ee:ff\t(Unknown)\n"
+    b"192.168.1.30\t11:22:33:44:55:66\n"
+    b"0.0.0.0\t00:00:00:00:00:00\tInvalid\n"
+    b"192.168.1.300\t22:33:44:55:66:77\tBogus\n"
+    b"\n"
+    b"3 packets received by filter, 0 packets dropped by kernel\n"
+)
+
+PROC_ARP = (
+    "IP address       HW type     Flags       HW address            Mask     Device\n"
+    "192.168.1.1      0x1         0x2         00:11:22:33:44:55     *        wlan0\n"
+    "192.168.1.9      0x1         0x0         00:00:00:00:00:00     *        wlan0\n"
+    "192.168.1.20     0x1         0x2         AA:BB:CC:DD:EE:FF     *        wlan0\n"
+)
+
+NMAP_OUTPUT = (
+    b"Starting Nmap 7.80 ( https://nmap.org )\n"
+    b"Nmap scan report for router.lan (192.168.1.1)\n"
+    b"Host is up (0.0020s latency).\n"
+    b"MAC Address: 00:11:22:33:44:55 (Netgear)\n"
+    b"Nmap scan report for 192.168.1.5\n"
+    b"Host is up.\n"
+    b"Nmap scan report for 192.168.1.7\n"
+    b"Host is up (0.0100s latency).\n"
+    b"MAC Address: AA:BB:CC:DD:EE:FF (Unknown)\n"
+    b"Nmap done: 256 IP addresses (3 hosts up) scanned in 2.50 seconds\n"
+)
+
+
+def _make_scanner():
+    """Create a scanner with network enrichment disabled"""
+    scanner = IPScannerScreen()
+    scanner._enrich_devices = lambda: None
+    return scanner
+
+
+def test_parse_arp_scan_output():
+    """Test arp-scan host lines are parsed and header/footer skipped"""
+    scanner = _make_scanner()
+    scanner._parse_arp_scan_output(ARP_SCAN_OUTPUT)
+
+    ips = [d['ip'] for d in scanner.devices]
+    assert ips == ['192.168.1.1', '192.168.1.20', '192.168.1.30'], f"Unexpected IPs: {ips}"
+    assert scanner.devices[0]['mac'] == '00:11:22:33:44:55'
+    assert scanner.devices[0]['name'] == 'NETGEAR'
+    assert scanner.devices[2]['name'] == 'Unknown', "Missing vendor should be Unknown"
+
+    print(f"✓ arp-scan parsing: {len(scanner.devices)} devices")
+
+
+def test_parse_streamed_lines():
+    """Test parsers accept output line by line as it streams in"""
+    scanner = _make_scanner()
+    scanner._parse_arp_scan_output(iter(ARP_SCAN_OUTPUT.splitlines(keepends=True)))
+    assert [d['ip'] for d in scanner.devices] == ['192.168.1.1', '192.168.1.20', '192.168.1.30']
+
+    scanner = _make_scanner()
+    scanner._parse_nmap_output(iter(NMAP_OUTPUT.splitlines(keepends=True)))
+    assert [d['ip'] for d in scanner.devices] == ['192.168.1.1', '192.168.1.7']
+
+    print("✓ Streamed line parsing")
+
+
+def test_parse_nmap_output():
+    """Test nmap MAC lines are paired with the preceding host report"""
+    scanner = _make_scanner()
+    scanner._parse_nmap_output(NMAP_OUTPUT)
+
+    ips = [d['ip'] for d in scanner.devices]
+    assert ips == ['192.168.1.1', '192.168.1.7'], f"Unexpected IPs: {ips}"
+    assert scanner.devices[0]['name'] == 'Netgear'
+    assert scanner.devices[1]['mac'] == 'aa:bb:cc:dd:ee:ff', "MACs are normalised to lowercase"
+
+    print(f"✓ nmap parsing: {len(scanner.devices)} devices")
+
+
+def test_proc_arp_merge():
+    """Test the kernel ARP cache fills MACs and adds ICMP-silent hosts"""
+    with tempfile.NamedTemporaryFile('w', suffix='.arp') as f:
+        f.write(PROC_ARP)
+        f.flush()
+        entries = _read_proc_arp(f.name)
+
+    assert entries == {'192.168.1.1': '00:11:22:33:44:55', '192.168.1.20': 'aa:bb:cc:dd:ee:ff'}, \
+        "Incomplete entries should be skipped"
+
+    scanner = _make_scanner()
+    scanner._append_device('192.168.1.1')
+    scanner._merge_arp_entries(entries)
+    assert [(d['ip'], d['mac']) for d in scanner.devices] == [
+        ('192.168.1.1', '00:11:22:33:44:55'),
+        ('192.168.1.20', 'aa:bb:cc:dd:ee:ff'),
+    ]
+    assert _read_proc_arp('/nonexistent/arp') == {}
+
+    print(f"✓ /proc/net/arp merge: {len(scanner.devices)} devices")
+
+
+def test_scan_uses_arp_cache():
+    """Test arp-scan only runs when the ARP cache misses hosts the sweep found"""
+    def scan(arp, sweep_ips):
+        scanner = _make_scanner()
+        scanner._cached_ip = '192.168.1.5'
+        commands = []
+        progress = []
+
+        def run_streaming(cmd, timeout, parse):
+            commands.append(cmd[0])
+            progress.append(scanner.scan_progress)
+            parse(ARP_SCAN_OUTPUT)
+            progress.append(scanner.scan_progress)
+            return 0, b''
+
+        def ping_sweep(network):
+            for ip in sweep_ips:
+                scanner._append_device(ip)
+            scanner.scan_progress = 60
+
+        scanner._ping_sweep = ping_sweep
+        scanner._run_streaming = run_streaming
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(ipscanner_screen, '_read_proc_arp', return_value=arp):
+            scanner.cache_file = f"{tmp}/ipscan_cache.json"
+            scanner._scan_network()
+        return scanner, commands, progress
+
+    # Every host that answered (bar ourselves) is in the ARP cache - no fork
+    arp = {'192.168.1.1': '00:11:22:33:44:55', '192.168.1.9': 'aa:aa:aa:aa:aa:aa', '10.0.0.1': 'bb:bb:bb:bb:bb:bb'}
+    scanner, commands, _ = scan(arp, ['192.168.1.1', '192.168.1.5'])
+    assert commands == [], "A complete ARP cache should skip arp-scan"
+    assert [(d['ip'], d['mac']) for d in scanner.devices] == [
+        ('192.168.1.1', '00:11:22:33:44:55'), ('192.168.1.5', 'Unknown'), ('192.168.1.9', 'aa:aa:aa:aa:aa:aa'),
+    ], "Sweep results plus ARP-cache-only hosts on our network"
+
+    # A host answered ping but has no ARP entry - arp-scan fills the gap
+    scanner, commands, progress = scan({'192.168.1.1': '00:11:22:33:44:55'}, ['192.168.1.1', '192.168.1.20'])
+    assert commands == ['arp-scan']
+    assert progress[0] == 60 and progress[1] >= 60, f"Progress must not go backwards: {progress}"
+    assert [(d['ip'], d['name']) for d in scanner.devices] == [
+        ('192.168.1.1', 'NETGEAR'), ('192.168.1.20', '(Unknown)'), ('192.168.1.30', 'Unknown'),
+    ], "arp-scan fills in rows already listed instead of duplicating them"
+
+    print("✓ Scan uses the kernel ARP cache")
+
+
+def test_hostname_cache():
+    """Test hostname lookups (including misses) are reused within the TTL"""
+    scanner = _make_scanner()
+    calls = []
+
+    def resolve(ip):
+        calls.append(ip)
+        return 'printer.local' if ip == '192.168.1.40' else ''
+
+    scanner._resolve_hostname = resolve
+    ipscanner_screen._hostname_cache.clear()
+
+    assert scanner._get_hostname('192.168.1.40') == 'printer.local'
+    assert scanner._get_hostname('192.168.1.41') == ''
+    assert scanner._get_hostname('192.168.1.40') == 'printer.local'
+    assert scanner._get_hostname('192.168.1.41') == ''
+    assert calls == ['192.168.1.40', '192.168.1.41'], f"Expected one lookup per IP, got {calls}"
+
+    # Expired entries are looked up again
+    ipscanner_screen._hostname_cache['192.168.1.40'] = ('printer.local', -ipscanner_screen.HOSTNAME_CACHE_TTL)
+    scanner._get_hostname('192.168.1.40')
+    assert calls[-1] == '192.168.1.40'
+    ipscanner_screen._hostname_cache.clear()
+
+    print("✓ Hostname cache")
+
+
+def test_probe_order_and_sort():
+    """Test the sweep probes every host once and results sort back by IP"""
+    order = _probe_order(254)
+    assert sorted(order) == list(range(254))
+    assert abs(order[1] - order[0]) > 1, "Consecutive probes should not be neighbours"
+    assert sorted(_probe_order(4094)) == list(range(4094)), "Larger networks are covered too"
+    assert _probe_order(1) == [0]
+
+    table = DeviceTable()
+    table.append('192.168.1.200', 'aa:bb:cc:dd:ee:ff', 'Printer')
+    table.append('192.168.1.3')
+    table.append('192.168.1.40', name='Phone', http=True)
+    table.sort_by_ip()
+
+    assert [table.ip(i) for i in range(len(table))] == ['192.168.1.3', '192.168.1.40', '192.168.1.200']
+    assert table.as_dict(1)['name'] == 'Phone' and table.as_dict(1)['http']
+    assert table.mac(2) == 'aa:bb:cc:dd:ee:ff', "MACs must move with their rows"
+
+    print("✓ Probe order and IP sort")
+
+
+def test_ping_sweep_fallback():
+    """Test falling back to ping subprocesses doesn't list hosts twice"""
+    scanner = _make_scanner()
+
+    async def failing_icmp_sweep(hosts):
+        scanner._append_device('192.168.1.1')
+        raise OSError("recvfrom failed")
+
+    def subprocess_sweep(hosts):
+        for ip in ('192.168.1.20', '192.168.1.1'):
+            scanner._append_device(ip)
+
+    scanner._icmp_sweep = failing_icmp_sweep
+    scanner._subprocess_ping_sweep = subprocess_sweep
+    scanner._ping_sweep(ipaddress.ip_network('192.168.1.0/24'))
+    assert [d['ip'] for d in scanner.devices] == ['192.168.1.1', '192.168.1.20']
+
+    print("✓ Ping sweep fallback")
+
+
+def test_needs_render():
+    """Test periodic redraws are skipped until something visible changes"""
+    scanner = _make_scanner()
+    scanner._cached_ip = '192.168.1.5'
+    scanner.scanning = True
+    scanner.scan_progress = 20
+    assert scanner.needs_render(), "First frame must render"
+
+    scanner.render()
+    assert not scanner.needs_render()
+
+    scanner.scan_progress = 23
+    assert not scanner.needs_render(), "Progress within the same 5% step is not worth a refresh"
+    scanner.scan_progress = 25
+    assert scanner.needs_render()
+
+    frame = scanner.render()
+    before = frame.tobytes()
+    scanner._append_device('192.168.1.1')
+    assert not scanner.needs_render(), "Devices found mid-scan wait for the next progress step"
+    scanner.scan_progress = 30
+    assert scanner.needs_render()
+    scanner.scanning = False
+    assert scanner.render() is not frame
+    assert frame.tobytes() == before, "Frames already handed out must not be repainted"
+
+    # Outside a scan (e.g. cached results loading) new devices show at once
+    scanner._append_device('192.168.1.2')
+    assert scanner.needs_render(), "New devices must be shown"
+
+    print("✓ Redraw coalescing")
+
+
+def test_scan_while_enriching():
+    """Test a scan request during name lookups is shown rather than lost silently"""
+    scanner = _make_scanner()
+    scanner._append_device('192.168.1.1')
+    scanner.render()
+
+    scanner.enriching = True
+    scanner.start_scan()
+    assert not scanner.scanning and len(scanner.devices) == 1, "Lookups finish before a new scan"
+    assert scanner.needs_render(), "The lookup status must be drawn"
+    enriching_frame = scanner.render()
+
+    scanner.enriching = False
+    assert scanner.needs_render()
+    assert scanner.render().tobytes() != enriching_frame.tobytes()
+
+    print("✓ Scan while enriching")
+
+
+if __name__ == '__main__':
+    print("Running IP scanner tests...\n")
+
+    try:
+        test_parse_arp_scan_output()
+        test_parse_nmap_output()
+        test_parse_streamed_lines()
+        test_proc_arp_merge()
+        test_scan_uses_arp_cache()
+        test_hostname_cache()
+        test_probe_order_and_sort()
+        test_ping_sweep_fallback()
+        test_needs_render()
+        test_scan_while_enriching()
+
+        print("\n" + "="*50)
+        print("ALL TESTS PASSED ✓")
+        print("="*50)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
@@ -0,0 +1,253 @@
+"""
+Unit tests for Klipper printer discovery
+"""
+
+import asyncio
+import json
+import socket
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.apps.klipper import screen as klipper_screen
+from src.apps.klipper.screen import KlipperScreen, PrinterTable
+
+
+class _MoonrakerHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive Moonraker stand-in that counts connections"""
+
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    paths = []
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self):
+        type(self).paths.append(self.path)
+        status = {
+            'webhooks': {'state': 'ready'},
+            'extruder': {'temperature': 210.5, 'target': 210.0},
+            'print_stats': {'state': 'printing', 'filename': 'gcodes/benchy.gcode'},
+        }
+        body = json.dumps({'result': {'status': status}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_probe_hosts():
+    """Test the concurrent TCP probe reports only hosts accepting on the port"""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(8)
+    port = listener.getsockname()[1]
+
+    try:
+        screen = KlipperScreen()
+        hosts = ['127.0.0.1', '127.0.0.2', '127.0.0.3']
+        found = asyncio.run(screen._probe_hosts(hosts, port, timeout=0.5))
+    finally:
+        listener.close()
+
+    assert found == ['127.0.0.1'], f"Unexpected hosts: {found}"
+    assert screen.scan_progress == 75, "Probe phase should end at 75%"
+
+    print(f"✓ TCP probe: {found}")
+
+
+def test_moonraker_keepalive():
+    """Test each poll is one status query and polls share a TCP connection"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _MoonrakerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    original_port = klipper_screen.MOONRAKER_PORT
+    klipper_screen.MOONRAKER_PORT = server.server_address[1]
+
+    try:
+        screen = KlipperScreen()
+        screen._get_hostname = lambda ip: ''
+        for _ in range(3):
+            info = screen._get_printer_info('127.0.0.1')
+        screen._close_connections()
+    finally:
+        klipper_screen.MOONRAKER_PORT = original_port
+        server.shutdown()
+        server.server_close()
+
+    assert info['state'] == 'printing', "print_stats should override the Klippy state"
+    assert info['klipper_version'] == 'ready'
+    assert info['extruder_temp'] == 210.5
+    assert info['filename'] == 'gcodes/benchy.gcode'
+    assert _MoonrakerHandler.paths == [klipper_screen.STATUS_QUERY] * 3, "Expected one query per poll"
+    assert _MoonrakerHandler.connections == 1, f"Expected 1 connection, got {_MoonrakerHandler.connections}"
+
+    print(f"✓ Moonraker keep-alive: {_MoonrakerHandler.connections} connection for 3 polls")
+
+
+def test_hostname_cache():
+    """Test hostname lookups are only repeated once the TTL expires"""
+    screen = KlipperScreen()
+    calls = []
+
+    def resolve(ip):
+        calls.append(ip)
+        return 'voron.local'
+
+    screen._resolve_hostname = resolve
+    for _ in range(3):
+        assert screen._get_hostname('192.168.1.50') == 'voron.local'
+    assert calls == ['192.168.1.50'], f"Expected a single lookup, got {calls}"
+
+    screen._hostname_cache['192.168.1.50'] = ('voron.local', -klipper_screen.HOSTNAME_CACHE_TTL)
+    screen._get_hostname('192.168.1.50')
+    assert len(calls) == 2, "Expired entries should be resolved again"
+
+    print("✓ Hostname cache")
+
+
+AVAHI_BROWSE_OUTPUT = (
+    "+;wlan0;IPv4;voron;_moonraker._tcp;local\n"
+    "=;wlan0;IPv6;voron;_moonraker._tcp;local;voron.local;fe80::1;7125;\n"
+    "=;wlan0;IPv4;voron;_moonraker._tcp;local;voron.local;192.168.1.50;7125;\n"
+    "=;wlan0;IPv4;ender;_moonraker._tcp;local;ender3.local;192.168.1.51;7125;\n"
+)
+
+
+def test_browse_mdns():
+    """Test avahi-browse answers yield IPv4 printers and seed hostnames"""
+    original_run = klipper_screen.subprocess.run
+
+    class Result:
+        stdout = AVAHI_BROWSE_OUTPUT
+
+    klipper_screen.subprocess.run = lambda *args, **kwargs: Result()
+    try:
+        screen = KlipperScreen()
+        found = screen._browse_mdns()
+        assert screen._get_hostname('192.168.1.51') == 'ender3.local'
+    finally:
+        klipper_screen.subprocess.run = original_run
+
+    assert found == ['192.168.1.50', '192.168.1.51'], f"Unexpected printers: {found}"
+
+    print(f"✓ mDNS browse: {found}")
+
+
+def test_known_printers_first():
+    """Test rescans keep known printers mDNS misses and still discover new ones"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _MoonrakerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    original_port = klipper_screen.MOONRAKER_PORT
+    klipper_screen.MOONRAKER_PORT = server.server_address[1]
+    browses = []
+
+    def make_screen(known_file, mdns_ips):
+        screen = KlipperScreen(known_file=known_file)
+        screen._get_local_ip = lambda: '127.0.0.9'
+        screen._get_hostname = lambda ip: ''
+        screen._browse_mdns = lambda: browses.append(1) or list(mdns_ips)
+        return screen
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            known_file = str(Path(tmp) / 'klipper_known.json')
+
+            # First scan has nothing saved, so it discovers and remembers
+            screen = make_screen(known_file, ['127.0.0.1'])
+            screen._scan_for_printers()
+            assert len(browses) == 1 and screen.printer_count == 1
+            assert json.loads(Path(known_file).read_text()) == {'network': '127.0.0', 'ips': ['127.0.0.1']}
+            screen._close_connections()
+
+            # Known printer still answers - discovery runs anyway and finds a new one
+            screen = make_screen(known_file, ['127.0.0.3'])
+            progress = []
+            probe_hosts = screen._probe_hosts
+
+            async def probe_known(hosts, port, timeout, report_progress=True):
+                found = await probe_hosts(hosts, port, timeout, report_progress)
+                progress.append(screen.scan_progress)
+                return found
+
+            screen._probe_hosts = probe_known
+            screen._scan_for_printers()
+            assert len(browses) == 2, "Explicit scans must always run discovery"
+            assert progress == [5], "Probing known printers must not move the progress bar"
+            assert sorted(p['ip'] for p in screen.printers) == ['127.0.0.1', '127.0.0.3'], \
+                "Known printers mDNS missed are kept alongside new ones"
+            assert json.loads(Path(known_file).read_text())['ips'] == ['127.0.0.3', '127.0.0.1']
+            screen._close_connections()
+
+            # A known printer went away - it is forgotten
+            screen = make_screen(known_file, ['127.0.0.1'])
+            screen._known_ips = ['127.0.0.1', '127.0.0.2']
+            screen._scan_for_printers()
+            assert len(browses) == 3
+            assert json.loads(Path(known_file).read_text())['ips'] == ['127.0.0.1']
+            screen._close_connections()
+    finally:
+        klipper_screen.MOONRAKER_PORT = original_port
+        server.shutdown()
+        server.server_close()
+
+    print("✓ Known printers probed first")
+
+
+def test_printer_table():
+    """Test printers round-trip through the columnar table, None included"""
+    info = {
+        'ip': '192.168.1.50', 'hostname': 'voron.local', 'state': 'printing',
+        'klipper_version': 'ready', 'filename': 'gcodes/benchy.gcode',
+        'extruder_temp': 210.5, 'extruder_target': 210.0,
+        'bed_temp': None, 'bed_target': None, 'progress': 0.25,
+    }
+    table = PrinterTable()
+    table.append(info)
+    assert len(table) == 1
+    assert table.as_dict(0) == info, f"Round trip changed the printer: {table.as_dict(0)}"
+
+    table.update(0, dict(info, state='complete', progress=None, bed_temp=60.0, bed_target=60.0))
+    updated = table.as_dict(0)
+    assert updated['state'] == 'complete' and updated['progress'] is None
+    assert updated['bed_temp'] == 60.0
+
+    screen = KlipperScreen()
+    empty = screen.render()
+    before = empty.tobytes()
+    screen._add_printer(info)
+    assert screen.printer_count == 1 and screen.printers == [info]
+    assert screen.render() is not empty
+    assert empty.tobytes() == before, "Frames already handed out must not be repainted"
+
+    print("✓ Printer table")
+
+
+if __name__ == '__main__':
+    print("Running Klipper tests...\n")
+
+    try:
+        test_probe_hosts()
+        test_moonraker_keepalive()
+        test_hostname_cache()
+        test_browse_mdns()
+        test_known_printers_first()
+        test_printer_table()
+
+        print("\n" + "="*50)
+        print("ALL TESTS PASSED ✓")
+        print("="*50)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
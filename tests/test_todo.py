@@ -0,0 +1,286 @@
+"""
+Unit tests for To-Do list persistence
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import ImageChops
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.apps.todo.manager import TodoManager
+from src.apps.todo.screen import ToDoScreen
+from src.utils.fonts import text_width
+from src.ui.navigation import Screen
+
+
+def test_save_and_load():
+    """Test todos round-trip and the atomic write leaves no temp files"""
+    with tempfile.TemporaryDirectory() as tmp:
+        todos_file = Path(tmp) / 'todos.json'
+        manager = TodoManager(todos_file=str(todos_file))
+        assert manager.load_todos() == {'tasks': []}, "Missing file should load as empty"
+
+        todos = {'tasks': [
+            {'id': 'a1', 'text': 'Buy filament', 'completed': False, 'created_at': '2024-01-01T10:00:00'},
+            {'id': 'b2', 'text': 'Café ☕', 'completed': True, 'created_at': '2024-01-02T10:00:00'},
+        ]}
+        assert manager.save_todos(todos)
+        assert manager.load_todos() == todos
+
+        os.chmod(todos_file, 0o664)
+        todos['tasks'].pop()
+        assert manager.save_todos(todos)
+        assert manager.load_todos() == todos
+        assert todos_file.stat().st_mode & 0o777 == 0o664, "Saving must not reset the mode to 0600"
+        assert [p.name for p in Path(tmp).iterdir()] == ['todos.json'], "Temp files must not be left behind"
+
+        # A failed swap cleans up its temp file too
+        blocked = Path(tmp) / 'dir_in_the_way'
+        blocked.mkdir()
+        assert not TodoManager(todos_file=str(blocked)).save_todos(todos)
+        assert sorted(p.name for p in Path(tmp).iterdir()) == ['dir_in_the_way', 'todos.json']
+
+    print("✓ Todo save/load")
+
+
+def test_load_cache():
+    """Test loads reuse the parsed todos until the file changes on disk"""
+    with tempfile.TemporaryDirectory() as tmp:
+        todos_file = Path(tmp) / 'todos.json'
+        todos_file.write_text(json.dumps([{'id': 'a1', 'text': 'Legacy list', 'completed': False}]))
+        manager = TodoManager(todos_file=str(todos_file))
+
+        first = manager.load_todos()
+        cache = manager._cache
+        assert first['tasks'][0]['text'] == 'Legacy list', "Legacy list format should still load"
+        assert manager.load_todos() == first and manager._cache is cache, "Unchanged file should not be parsed again"
+
+        # Callers get copies, so changing one can't leave the cache out of step with the file
+        first['tasks'][0]['text'] = 'Changed'
+        first['tasks'].append({'id': 'x', 'text': 'Unsaved', 'completed': False})
+        assert manager.load_todos()['tasks'] == [{'id': 'a1', 'text': 'Legacy list', 'completed': False}]
+        assert manager.get_by_id('a1') is not manager.get_by_id('a1')
+
+        # Written by someone else (e.g. the e-ink screen) - must be re-read
+        todos_file.write_text(json.dumps({'tasks': []}))
+        stat = todos_file.stat()
+        os.utime(todos_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert manager.load_todos() == {'tasks': []}
+
+        # Rewritten in place within the same mtime tick - the size gives it away
+        manager.load_todos()
+        stat = todos_file.stat()
+        todos_file.write_text(json.dumps({'tasks': [{'id': 'c3', 'text': 'Same tick', 'completed': False}]}))
+        os.utime(todos_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert manager.load_todos()['tasks'][0]['id'] == 'c3', "Same mtime but new contents must be re-read"
+
+        # An unreadable file must not leave the old id index behind
+        todos_file.write_text(json.dumps([{'id': 'a1', 'text': 'Legacy list', 'completed': False}]))
+        manager.load_todos()
+        todos_file.write_text('{"tasks": [')
+        stat = todos_file.stat()
+        os.utime(todos_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+        assert manager.load_todos() == {'tasks': []}
+        assert manager.update_by_id('a1', lambda t: t.update(text='x')) is None
+        assert not manager.remove_by_id('a1')
+
+        saved = {'tasks': [{'id': 'b2', 'text': 'Saved', 'completed': False}]}
+        manager.save_todos(saved)
+        assert manager.load_todos() == saved, "Saving should refresh the cache"
+        saved['tasks'].clear()
+        assert len(manager.load_todos()['tasks']) == 1, "The cache must not share the saved dict"
+
+    print("✓ Todo load cache")
+
+
+def test_id_lookup():
+    """Test tasks are found and removed by id, with the index kept in step"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = TodoManager(todos_file=str(Path(tmp) / 'todos.json'))
+        todos = {'tasks': [{'id': f't{i}', 'text': f'Task {i}', 'completed': False} for i in range(5)]}
+        manager.save_todos(todos)
+
+        task = manager.get_by_id('t3')
+        assert task['text'] == 'Task 3'
+        assert manager.get_by_id('missing') is None
+
+        # Tasks come back as copies - changes go through update_by_id()
+        task['completed'] = True
+        assert not manager.get_by_id('t3')['completed']
+
+        # Lookup, change and save in one locked step
+        updated = manager.update_by_id('t2', lambda t: t.update(text='Edited'))
+        assert updated['text'] == 'Edited' and updated['id'] == 't2'
+        assert manager.update_by_id('missing', lambda t: t.update(text='x')) is None
+        assert TodoManager(todos_file=str(Path(tmp) / 'todos.json')).get_by_id('t2')['text'] == 'Edited'
+
+        assert manager.remove_by_id('t1')
+        assert not manager.remove_by_id('t1'), "Removing twice should report not found"
+        assert manager.get_by_id('t4')['text'] == 'Task 4', "Later tasks must stay reachable"
+        assert [t['id'] for t in manager.load_todos()['tasks']] == ['t0', 't2', 't3', 't4']
+
+        todos = manager.load_todos()
+        todos['tasks'].append({'id': 't5', 'text': 'Task 5', 'completed': False})
+        manager.save_todos(todos)
+        assert manager.get_by_id('t5')['text'] == 'Task 5', "Saving should index new tasks"
+        assert manager.add_task({'id': 't6', 'text': 'Task 6', 'completed': False})
+        assert [t['id'] for t in manager.load_todos()['tasks']] == ['t0', 't2', 't3', 't4', 't5', 't6']
+
+    print("✓ Todo id lookup")
+
+
+class _FakeApp:
+    """Just enough of PiBookApp for refresh_screen()"""
+
+    class navigation:
+        current_screen = Screen.TODO
+
+    def __init__(self):
+        self.renders = 0
+
+    def _render_current_screen(self, force_partial=False):
+        self.renders += 1
+
+
+def test_refresh_debounce():
+    """Test a burst of refresh requests ends in a single redraw"""
+    app = _FakeApp()
+    manager = TodoManager(app_instance=app)
+    manager.REFRESH_DEBOUNCE = 0.05
+
+    for _ in range(5):
+        assert manager.refresh_screen()
+    time.sleep(0.3)
+    assert app.renders == 1, f"Expected 1 redraw, got {app.renders}"
+
+    manager.refresh_screen()
+    time.sleep(0.3)
+    assert app.renders == 2, "Later edits must still redraw"
+    assert not TodoManager().refresh_screen(), "No app, nothing to refresh"
+
+    print(f"✓ Refresh debounce: {app.renders} redraws")
+
+
+def test_screen_reload_on_change():
+    """Test the e-ink screen only re-reads todos.json when it changes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        todos_file = Path(tmp) / 'todos.json'
+        todos_file.write_text(json.dumps({'tasks': [{'text': 'First', 'completed': False}]}))
+
+        screen = ToDoScreen()
+        screen.todos_file = str(todos_file)
+        screen._load_todos()
+        assert [t['text'] for t in screen.todos] == ['First']
+
+        loaded = screen.todos
+        screen.render()
+        assert screen.todos is loaded, "Unchanged file should not be parsed again"
+
+        # Written by the web API - picked up on the next render
+        todos_file.write_text(json.dumps({'tasks': [{'text': 'Second', 'completed': True}]}))
+        stat = todos_file.stat()
+        os.utime(todos_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        screen.render()
+        assert [t['text'] for t in screen.todos] == ['Second']
+
+        # The screen's own saves don't trigger a reload
+        os.chmod(todos_file, 0o664)
+        inode = todos_file.stat().st_ino
+        screen.add_todo('Third')
+        loaded = screen.todos
+        screen.render()
+        assert screen.todos is loaded and len(loaded) == 2
+
+        # ...and are swapped in whole, like the web side's, keeping the mode
+        assert todos_file.stat().st_ino != inode, "Screen saves must not rewrite the file in place"
+        assert todos_file.stat().st_mode & 0o777 == 0o664
+        assert [p.name for p in Path(tmp).iterdir()] == ['todos.json']
+        assert [t['text'] for t in TodoManager(todos_file=str(todos_file)).load_todos()['tasks']] == ['Second', 'Third']
+
+    print("✓ Todo screen reload on change")
+
+
+def test_selection_redraw():
+    """Test moving the selection repaints to the same frame as a full render"""
+    with tempfile.TemporaryDirectory() as tmp:
+        todos_file = Path(tmp) / 'todos.json'
+        texts = ['Buy milk', 'A long task that has to wrap onto a second line of the list', '', 'Pay gas bill']
+        todos_file.write_text(json.dumps({'tasks': [{'text': t, 'completed': i == 1} for i, t in enumerate(texts)]}))
+
+        def full_render(index):
+            screen = ToDoScreen()
+            screen.todos_file = str(todos_file)
+            screen._load_todos()
+            screen.current_index = index
+            return screen.render()
+
+        screen = ToDoScreen()
+        screen.todos_file = str(todos_file)
+        screen._load_todos()
+        screen.render()
+        for _ in range(3):
+            screen.move_down()
+            image = screen.render()
+            assert ImageChops.difference(image, full_render(screen.current_index)).getbbox() is None, \
+                f"Selection redraw differs at item {screen.current_index}"
+
+        rows = screen._layout_rows()
+        assert screen._layout_rows() is rows, "Layout should be reused while the todos are unchanged"
+
+        # Edits still redraw the whole list
+        screen.toggle_todo()
+        assert screen._layout_rows() is not rows
+        assert ImageChops.difference(screen.render(), image).getbbox() is not None
+
+    print("✓ Todo selection redraw")
+
+
+def test_screen_word_wrap():
+    """Test task text wraps to the width, truncates long words and is memoized"""
+    screen = ToDoScreen()
+    font = screen.item_font
+
+    lines = [line for line, _, _ in screen._wrap_text("one two three four five six seven eight nine ten", 200, 3)]
+    assert 1 < len(lines) <= 3
+    assert all(text_width(font, line) <= 200 for line in lines[:-1])
+
+    lines = [line for line, _, _ in screen._wrap_text("x" * 200, 300, 3)]
+    assert len(lines) == 1 and lines[0].endswith("..."), "Overlong words are truncated"
+    assert text_width(font, lines[0]) <= 300
+    assert text_width(font, lines[0][:-3] + "x...") > 300, "Truncation should keep as much as fits"
+
+    lines = screen._wrap_text("word " * 100, 300, 3)
+    assert len(lines) == 3
+    line, right, height = lines[0]
+    assert right == screen.item_font.getbbox(line)[2] and height > 0, "Lines carry their ink extent"
+    assert screen._wrap_text("word " * 100, 300, 3) is lines, "Wrapped lines should be reused"
+
+    print("✓ Todo word wrap")
+
+
+if __name__ == '__main__':
+    print("Running To-Do tests...\n")
+
+    try:
+        test_save_and_load()
+        test_load_cache()
+        test_id_lookup()
+        test_refresh_debounce()
+        test_screen_reload_on_change()
+        test_selection_redraw()
+        test_screen_word_wrap()
+
+        print("\n" + "="*50)
+        print("ALL TESTS PASSED ✓")
+        print("="*50)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
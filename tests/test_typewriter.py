@@ -0,0 +1,255 @@
+"""
+Unit tests for the Typewriter terminal and word processor
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image, ImageChops, ImageDraw
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.apps.typewriter.screen import TypewriterScreen
+
+
+def _make_screen():
+    """Create a screen whose documents directory is under a temp home"""
+    with mock.patch.dict(os.environ, {'HOME': tempfile.mkdtemp()}):
+        return TypewriterScreen()
+
+
+def test_blit_text_matches_draw_text():
+    """Test cached line masks put down the same pixels as draw.text"""
+    screen = _make_screen()
+
+    for font in (screen.mono_font, screen.mono_bold):
+        for text in ("pi$ ls -la ~/www", "The quick brown fox~", " ", "naïve café", ""):
+            expected = Image.new('1', (400, 40), 1)
+            ImageDraw.Draw(expected).text((20, 5), text, font=font, fill=0)
+            actual = Image.new('1', (400, 40), 1)
+            screen._blit_text(ImageDraw.Draw(actual), 20, 5, text, font)
+            assert ImageChops.difference(expected.convert('L'), actual.convert('L')).getbbox() is None, \
+                f"Blitted text differs for {text!r}"
+
+    print("✓ Cached text masks match draw.text")
+
+
+def test_terminal_line_count():
+    """Test the running line count matches a full recount of the history"""
+    screen = _make_screen()
+    assert screen._terminal_total_lines == 1, "Empty terminal still has the input line"
+
+    screen._add_history('ls', 'a\nb\nc')
+    screen._add_history('cat log', 'x' * (screen.chars_per_line * 2 + 5))
+    screen.terminal_input = 'cd /nonexistent'
+    screen.terminal_execute()
+
+    expected = 1
+    for _, output in screen.terminal_history:
+        expected += 1 + sum(len(line) // screen.chars_per_line + 1 for line in output.split('\n'))
+    assert screen._terminal_total_lines == expected == 11, f"Expected {expected}, got {screen._terminal_total_lines}"
+
+    screen.terminal_input = 'clear'
+    screen.terminal_execute()
+    assert screen._terminal_total_lines == 1 and not screen.terminal_history
+
+    print("✓ Terminal line count")
+
+
+def test_cd_builtin():
+    """Test cd resolves ~, relative paths and reports missing directories"""
+    screen = _make_screen()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.mkdir(os.path.join(tmp, 'sub'))
+        for command in (f'cd {tmp}', 'cd sub', 'cd ../sub/..'):
+            screen.terminal_input = command
+            screen.terminal_execute()
+        assert screen.current_dir == tmp
+        assert screen._prompt_prefix == os.path.basename(tmp) + '$ '
+
+        screen.terminal_input = 'cd missing'
+        screen.terminal_execute()
+        assert screen.terminal_history[-1][1] == f"Directory not found: {os.path.join(tmp, 'missing')}"
+
+    screen.terminal_input = 'cd ~'
+    screen.terminal_execute()
+    assert screen.current_dir == screen._home
+
+    print("✓ cd built-in")
+
+
+def test_terminal_wrap_cache():
+    """Test history is wrapped once and re-wrapped only when the prompt changes"""
+    screen = _make_screen()
+    screen._add_history('ls', 'a\nb')
+    screen.render()
+    wrapped = screen._wrapped_history
+    assert [text for _, text in wrapped[1:]] == ['a', 'b']
+
+    screen.terminal_type_char('x')
+    screen.render()
+    assert screen._wrapped_history is wrapped, "Typing should not re-wrap history"
+
+    screen._add_history('cat log', 'y' * (screen.chars_per_line + 1))
+    screen.render()
+    assert screen._wrapped_history is wrapped and len(wrapped) == 6, "New entries are appended"
+
+    screen.terminal_input = 'cd /tmp'
+    screen.terminal_execute()
+    screen.render()
+    assert screen._wrapped_history[0] == ('prompt', 'tmp$ ls'), "Prompts follow the current directory"
+
+    print("✓ Terminal wrap cache")
+
+
+def test_wp_editing():
+    """Test typing and backspace at the end and in the middle of a line"""
+    screen = _make_screen()
+    for ch in 'helo':
+        screen.wp_type_char(ch)
+    screen.wp_move_left()
+    screen.wp_type_char('l')
+    assert screen.document_lines == ['hello'] and screen.cursor_col == 4
+
+    screen.wp_move_right()
+    screen.wp_backspace()
+    assert screen.document_lines == ['hell'] and screen.cursor_col == 4
+    screen.wp_move_left()
+    screen.wp_backspace()
+    assert screen.document_lines == ['hel'] and screen.cursor_col == 2
+
+    screen.wp_enter()
+    assert screen.document_lines == ['he', 'l']
+    screen.wp_backspace()
+    assert screen.document_lines == ['hel'] and screen.cursor_col == 2
+
+    print("✓ Word processor editing")
+
+
+def test_wp_cursor_bar():
+    """Test the cursor is drawn as a bar without shifting the line's text"""
+    screen = _make_screen()
+    screen.toggle_mode()
+    for ch in 'hello world':
+        screen.wp_type_char(ch)
+    at_end = screen.render()
+    for _ in range(6):
+        screen.wp_move_left()
+    in_middle = screen.render()
+
+    # Only the two cursor columns differ
+    old_x = screen.margin + 11 * screen.char_width - 1
+    new_x = screen.margin + 5 * screen.char_width - 1
+    diff = ImageChops.difference(at_end.convert('L'), in_middle.convert('L'))
+    left, _, right, _ = diff.getbbox()
+    assert (left, right) == (new_x, old_x + 1), f"Unexpected change in columns {left}..{right}"
+    assert diff.crop((left + 1, 0, right - 1, diff.height)).getbbox() is None, "Text must not move"
+
+    print("✓ Word processor cursor bar")
+
+
+def test_run_command():
+    """Test commands return stdout then stderr, capped and with a timeout"""
+    screen = _make_screen()
+    assert screen._run_command("printf 'out\\r\\n'; printf 'err' >&2") == 'out\nerr'
+
+    screen.OUTPUT_READ_LIMIT = 100
+    output = screen._run_command("head -c 200000 /dev/zero | tr '\\0' x")
+    assert output == 'x' * 100, "Output past the limit should be drained and dropped"
+
+    screen.COMMAND_TIMEOUT = 0.2
+    start = time.monotonic()
+    screen.terminal_input = 'sleep 5'
+    screen.terminal_execute()
+    assert time.monotonic() - start < 2, "Timed-out commands must be killed"
+    assert screen.terminal_history[-1] == ('sleep 5', 'Command timed out (0.2s limit)')
+
+    print("✓ Terminal command execution")
+
+
+def test_history_limits():
+    """Test long output is truncated and old entries drop off with their lines"""
+    screen = _make_screen()
+    screen._add_history('cat big', 'z' * (screen.MAX_OUTPUT_CHARS + 100))
+    assert screen.terminal_history[0][1].endswith('...(truncated)')
+    assert len(screen.terminal_history[0][1]) < screen.MAX_OUTPUT_CHARS + 20
+
+    screen.MAX_HISTORY = 5
+    screen.render()
+    for i in range(8):
+        screen._add_history(f'echo {i}', f'{i}\n' * i)
+        if i % 3 == 0:
+            screen.render()
+    screen.render()
+
+    assert [cmd for cmd, _ in screen.terminal_history] == [f'echo {i}' for i in range(3, 8)]
+    fresh = _make_screen()
+    fresh._prompt_prefix = screen._prompt_prefix
+    for cmd, output in screen.terminal_history:
+        fresh._add_history(cmd, output)
+    fresh.render()
+    assert screen._terminal_total_lines == fresh._terminal_total_lines
+    assert screen._wrapped_history == fresh._wrapped_history, "Wrapped lines must drop with their entries"
+
+    print("✓ Terminal history limits")
+
+
+def test_header_cache():
+    """Test the header is redrawn only when the tab or battery changes"""
+    class _FakeBattery:
+        percentage = 80
+
+        def get_percentage(self):
+            return self.percentage
+
+        def is_charging(self):
+            return False
+
+    battery = _FakeBattery()
+    with mock.patch.dict(os.environ, {'HOME': tempfile.mkdtemp()}):
+        screen = TypewriterScreen(battery_monitor=battery)
+
+    screen.render()
+    header = screen._header_image
+    screen.terminal_type_char('l')
+    screen.render()
+    assert screen._header_image is header, "Typing should reuse the header"
+
+    battery.percentage = 79
+    screen.render()
+    assert screen._header_image is not header
+    header = screen._header_image
+
+    screen.toggle_mode()
+    assert screen.render().crop((0, 0, screen.width, screen.header_height)) != \
+        header.crop((0, 0, screen.width, screen.header_height)), "Switching tabs redraws the header"
+
+    print("✓ Header cache")
+
+
+if __name__ == '__main__':
+    print("Running Typewriter tests...\n")
+
+    try:
+        test_blit_text_matches_draw_text()
+        test_terminal_line_count()
+        test_cd_builtin()
+        test_terminal_wrap_cache()
+        test_wp_editing()
+        test_wp_cursor_bar()
+        test_run_command()
+        test_history_limits()
+        test_header_cache()
+
+        print("\n" + "="*50)
+        print("ALL TESTS PASSED ✓")
+        print("="*50)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)